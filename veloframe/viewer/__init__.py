@@ -1,7 +1,27 @@
 """
 VeloFrame Viewer - Photo frame viewer package
 """
-from .photo_frame import PhotoFrame
-from .photo_display import PhotoDisplay
-from .config_manager import Config
-from .photo_file_set import PhotoFileSet
+import importlib
+
+# Public names mapped to the submodules that define them. These are imported
+# lazily so that e.g. importing Config doesn't pull in PySide6.
+_LAZY = {
+    'PhotoFrame': '.photo_frame',
+    'PhotoDisplay': '.photo_display',
+    'Config': '.config_manager',
+    'PhotoFileSet': '.photo_file_set',
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
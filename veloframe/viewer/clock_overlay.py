@@ -3,11 +3,40 @@ Manages clock overlay for photo display.
 """
 from PySide6.QtGui import QFont, QColor, QBrush, QPen
 from PySide6.QtCore import Qt, QTimer
+import re
+import time
+from datetime import datetime
 import arrow
 
+# Arrow format tokens that change every second (seconds, fractions, timestamps);
+# bracketed text is escaped literal text and can't contain tokens
+_SECOND_TOKENS = re.compile(r'[sSXx]')
+_ESCAPED_TEXT = re.compile(r'\[.*?\]')
+
+# Distance of the clock from the scene edge
+_EDGE_DISTANCE = 0
+
+# Clock rectangle (x, y) for each supported position, given the scene and rect sizes
+_CLOCK_POSITIONS = {
+    'top-left': lambda scene_w, scene_h, rect_w, rect_h: (_EDGE_DISTANCE, _EDGE_DISTANCE),
+    'top-center': lambda scene_w, scene_h, rect_w, rect_h: ((scene_w - rect_w) / 2, _EDGE_DISTANCE),
+    'top-right': lambda scene_w, scene_h, rect_w, rect_h: (scene_w - rect_w - _EDGE_DISTANCE, _EDGE_DISTANCE),
+    'bottom-center': lambda scene_w, scene_h, rect_w, rect_h: ((scene_w - rect_w) / 2,
+                                                               scene_h - rect_h - _EDGE_DISTANCE),
+}
+
+
 class ClockManager:
     """Manages clock overlay for photo display."""
     
+    __slots__ = (
+        'scene', 'config', 'timer', 'ui_components',
+        '_style_cache_key', '_font', '_brush', '_nopen', '_white',
+        '_last_render_key', '_applied_style_key', '_position', '_position_fn',
+        '_scene_width', '_scene_height',
+        '__weakref__',  # Needed to connect bound methods to Qt signals
+    )
+    
     def __init__(self, scene, config):
         """Initialize the clock manager.
         
@@ -20,15 +49,66 @@ class ClockManager:
         self.timer = None
         self.ui_components = None
         # Don't start the timer here - wait until UI components are set
+        
+        # Cached Qt objects, rebuilt only when the settings they depend on change
+        self._style_cache_key = None
+        self._font = None
+        self._brush = None
+        self._nopen = QPen(Qt.PenStyle.NoPen)
+        self._white = QColor(255, 255, 255)
+        
+        # Last rendered state, used to skip redundant text and layout updates
+        self._last_render_key = None
+        self._applied_style_key = None
+        
+        # Position function for the configured clock position
+        self._position = None
+        self._position_fn = None
+        
+        # Scene size, kept up to date by the scene's resize signal
+        scene_rect = scene.sceneRect()
+        self._scene_width = scene_rect.width()
+        self._scene_height = scene_rect.height()
+        scene.sceneRectChanged.connect(self._on_scene_rect_changed)
+    
+    def _on_scene_rect_changed(self, rect):
+        """Cache the new scene dimensions.
+        
+        Args:
+            rect: The new scene rectangle
+        """
+        self._scene_width = rect.width()
+        self._scene_height = rect.height()
     
     def _start_timer(self):
         """Start the timer to update the clock."""
         if self.timer is None:
             self.timer = QTimer()
-            # Update every second
-            self.timer.setInterval(1000)
-            self.timer.timeout.connect(self._update_clock)
-            self.timer.start()
+            self.timer.setSingleShot(True)
+            self.timer.timeout.connect(self._on_timer)
+            self._schedule_next_tick()
+    
+    def _get_update_period_ms(self):
+        """Get the clock update period based on the smallest unit in the clock format.
+        
+        Returns:
+            1000 if the format displays seconds, otherwise 60000
+        """
+        time_format = _ESCAPED_TEXT.sub('', self.config.get('clock_format', 'HH:mm'))
+        return 1000 if _SECOND_TOKENS.search(time_format) else 60000
+    
+    def _schedule_next_tick(self):
+        """Schedule the next update just after the next second/minute boundary."""
+        period_ms = self._get_update_period_ms()
+        now_ms = int(time.time() * 1000)
+        # Small slack so the tick lands after the boundary rather than just before it
+        self.timer.start(period_ms - now_ms % period_ms + 5)
+    
+    def _on_timer(self):
+        """Update the clock and re-arm the timer."""
+        self._update_clock()
+        if self.timer is not None:
+            self._schedule_next_tick()
     
     def _stop_timer(self):
         """Stop the timer."""
@@ -54,75 +134,84 @@ class ClockManager:
         if not self.ui_components:
             return
             
+        cfg = self.config.view
+        
         # If clock is disabled, hide it and return
-        if not self.config.get('show_clock', False):
+        if not cfg.show_clock:
             self.hide_overlay()
             return
         
-        # Get current date and time using Arrow
-        current_datetime = arrow.now()
         # Format according to config (default: 24 hour time and minutes)
-        time_format = self.config.get('clock_format', 'HH:mm')
-        time_str = current_datetime.format(time_format)
+        strftime_format = self.config.get_clock_strftime_format()
+        if strftime_format is not None:
+            time_str = datetime.now().strftime(strftime_format)
+        else:
+            # Fall back to Arrow for tokens strftime can't express exactly
+            time_str = arrow.now().format(cfg.clock_format)
+        
+        # Configure font and background brush
+        font_name = cfg.clock_font
+        font_size = cfg.clock_point_size
+        opacity = cfg.clock_opacity
+        
+        style_key = (font_name, font_size, opacity)
+        if style_key != self._style_cache_key:
+            self._font = QFont(font_name)
+            self._font.setPointSize(font_size)
+            self._brush = QBrush(QColor(0, 0, 0, int(opacity * 2.55)))  # Convert 0-100 to 0-255
+            self._style_cache_key = style_key
+            self._last_render_key = None
         
-        # Configure font
-        font_name = self.config.get('clock_font', 'segoeui.ttf')
-        font_size = self.config.get('clock_point_size', 12)
+        # Position based on configuration
+        position = cfg.clock_position
+        
+        # Get scene dimensions
+        scene_width = self._scene_width
+        scene_height = self._scene_height
         
-        font = QFont(font_name)
-        font.setPointSize(font_size)
+        # Nothing visible has changed since the last update
+        render_key = (time_str, position, scene_width, scene_height)
+        if render_key == self._last_render_key:
+            return
+        self._last_render_key = render_key
         
-        self.ui_components.clock_text.setFont(font)
-        self.ui_components.clock_text.setPlainText(time_str)
-        self.ui_components.clock_text.setDefaultTextColor(QColor(255, 255, 255))  # Ensure white text
+        clock_rect, clock_text = self.ui_components.clock_items()
+        
+        # Only touch style properties when they differ from what was last applied
+        if self._applied_style_key != self._style_cache_key:
+            clock_text.setFont(self._font)
+            clock_text.setDefaultTextColor(self._white)  # Ensure white text
+            clock_rect.setBrush(self._brush)
+            clock_rect.setPen(self._nopen)  # No border
+            clock_rect.setVisible(True)
+            clock_text.setVisible(True)
+            self._applied_style_key = self._style_cache_key
+        
+        clock_text.setPlainText(time_str)
         
         # Calculate text dimensions
-        text_width = self.ui_components.clock_text.boundingRect().width()
-        text_height = self.ui_components.clock_text.boundingRect().height()
+        text_rect = clock_text.boundingRect()
+        text_width = text_rect.width()
+        text_height = text_rect.height()
         
         # Set padding
         padding = 5
         
-        # Get scene dimensions
-        scene_rect = self.scene.sceneRect()
-        scene_width = scene_rect.width()
-        scene_height = scene_rect.height()
-        
         # Prepare rect dimensions
         rect_width = text_width + padding * 2
         rect_height = text_height + padding * 2
         
-        # Position based on configuration
-        position = self.config.get('clock_position', 'top-left')
-
-        # Distance from edge
-        edge_distance = 0
-        
-        if position == 'top-left':
-            rect_x = edge_distance
-            rect_y = edge_distance
-        elif position == 'top-center':
-            rect_x = (scene_width - rect_width) / 2
-            rect_y = edge_distance
-        elif position == 'top-right':
-            rect_x = scene_width - rect_width - edge_distance
-            rect_y = edge_distance
-        elif position == 'bottom-center':
-            rect_x = (scene_width - rect_width) / 2
-            rect_y = scene_height - rect_height - edge_distance
-        else:
-            # Default to top-left
-            rect_x = edge_distance
-            rect_y = edge_distance
+        if position != self._position:
+            # Unknown positions default to top-left
+            self._position_fn = _CLOCK_POSITIONS.get(position, _CLOCK_POSITIONS['top-left'])
+            self._position = position
+        rect_x, rect_y = self._position_fn(scene_width, scene_height, rect_width, rect_height)
         
-        # Configure rectangle
-        self.ui_components.clock_rect.setRect(rect_x, rect_y, rect_width, rect_height)
-        opacity = self.config.get('clock_opacity', 30)
-        self.ui_components.clock_rect.setBrush(QBrush(QColor(0, 0, 0, int(opacity * 2.55))))  # Convert 0-100 to 0-255
-        self.ui_components.clock_rect.setPen(QPen(Qt.PenStyle.NoPen))  # No border
+        # Configure rectangle (setRect/setPos are no-ops when the geometry is unchanged)
+        clock_rect.setRect(rect_x, rect_y, rect_width, rect_height)
         
         # Position text
-        self.ui_components.clock_text.setPos(rect_x + padding, rect_y + padding)
+        clock_text.setPos(rect_x + padding, rect_y + padding)
     
     def show_overlay(self):
         """Show clock overlay."""
@@ -141,6 +230,13 @@ class ClockManager:
     def hide_overlay(self):
         """Hide clock overlay."""
         if self.ui_components:
-            self.ui_components.clock_rect.setBrush(QBrush(QColor(0, 0, 0, 0)))
-            self.ui_components.clock_text.setPlainText("")
+            # Nothing to clear if the clock was never shown
+            if self._applied_style_key is not None:
+                # Hidden items are skipped when painting, unlike a transparent brush
+                clock_rect, clock_text = self.ui_components.clock_items()
+                clock_rect.setVisible(False)
+                clock_text.setVisible(False)
+                clock_text.setPlainText("")
+            self._last_render_key = None
+            self._applied_style_key = None
             self._stop_timer()
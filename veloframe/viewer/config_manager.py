@@ -1,13 +1,71 @@
 import os
+import re
+import json
+import tempfile
+import types
 import yaml
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from PIL import ImageFont
 
+# Prefer the libyaml-backed C loader/dumper when available
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+
+# Tokenizer matching Arrow's formatter, and the Arrow tokens with an exact,
+# locale-independent strftime equivalent
+_ARROW_TOKENS = re.compile(
+    r'(\[(?:(?!\]).)*\]|YYY?Y?|MM?M?M?|Do|DD?D?D?|d?dd?d?|HH?|hh?|mm?|ss?|SS?S?S?S?S?|ZZ?Z?|a|A|X|x|W)'
+)
+_ARROW_TO_STRFTIME = {
+    'YYYY': '%Y',
+    'YY': '%y',
+    'MM': '%m',
+    'DD': '%d',
+    'HH': '%H',
+    'hh': '%I',
+    'mm': '%M',
+    'ss': '%S',
+}
+
+
+def arrow_to_strftime(arrow_format: str) -> Optional[str]:
+    """Translate an Arrow format string into an equivalent strftime format.
+    
+    Args:
+        arrow_format: Arrow format string, e.g. "HH:mm"
+        
+    Returns:
+        The strftime format string, or None if the format uses tokens without
+        an exact strftime equivalent (names, unpadded numbers, AM/PM, etc.)
+    """
+    parts = []
+    for i, part in enumerate(_ARROW_TOKENS.split(arrow_format)):
+        if i % 2 == 0:
+            # Text between tokens is copied literally
+            parts.append(part.replace('%', '%%'))
+        elif part.startswith('['):
+            parts.append(part[1:-1].replace('%', '%%'))
+        elif part in _ARROW_TO_STRFTIME:
+            parts.append(_ARROW_TO_STRFTIME[part])
+        else:
+            return None
+    return ''.join(parts)
+
+
+@lru_cache(maxsize=8)
+def _load_truetype(font_name: str, point_size: int) -> ImageFont.FreeTypeFont:
+    """Load a TrueType font, memoized by name and size."""
+    return ImageFont.truetype(font_name, point_size)
+
 
 class Config:
     """Handles configuration loading and validation for the photo frame application."""
     
+    __slots__ = ('_config', 'config_path', 'view', '_clock_format', '_clock_strftime_format')
+    
     # Default configuration values
     DEFAULTS = {
         'photos_directory': str(Path.home() / 'Pictures'),
@@ -36,6 +94,9 @@ class Config:
         """
         self._config = self.DEFAULTS.copy()
         self.config_path = config_path
+        self._clock_format = None
+        self._clock_strftime_format = None
+        self._refresh_view()
         
         if config_path and os.path.exists(config_path):
             self.load()
@@ -52,13 +113,91 @@ class Config:
         if not self.config_path or not os.path.exists(self.config_path):
             return
             
+        # Prefer the JSON sidecar if it was written for this exact version of the
+        # YAML file; stat before reading so a concurrent edit can't be missed
+        source = self._config_source()
+        user_config = self._load_json_cache(source)
+        if user_config is not None:
+            self._config.update(user_config)
+            self._refresh_view()
+            return
+            
         try:
             with open(self.config_path, 'r') as f:
-                user_config = yaml.safe_load(f) or {}
+                user_config = yaml.load(f, Loader=_YAML_LOADER) or {}
                 # Allow all configuration settings from the file, not just ones in DEFAULTS
                 self._config.update(user_config)
         except Exception as e:
             print(f"Error loading config file: {e}. Using default settings.")
+            return
+        finally:
+            self._refresh_view()
+        
+        self._write_json_cache(source, user_config)
+    
+    def _json_cache_path(self) -> str:
+        """Get the path of the JSON sidecar cache for the YAML config file."""
+        return self.config_path + '.cache.json'
+    
+    def _config_source(self) -> Optional[List[int]]:
+        """Identify the current version of the YAML file for the JSON sidecar.
+        
+        Returns:
+            [mtime_ns, size] of the YAML file, or None if it can't be read.
+        """
+        try:
+            st = os.stat(self.config_path)
+        except OSError:
+            return None
+        return [st.st_mtime_ns, st.st_size]
+    
+    def _load_json_cache(self, source: Optional[List[int]]) -> Optional[Dict[str, Any]]:
+        """Load the JSON sidecar cache if it was written for the given YAML file version.
+        
+        Only an exact match counts: a YAML file replaced by one with an older
+        mtime (e.g. restored from a backup or copied with rsync -a) still
+        invalidates the cache.
+        
+        Args:
+            source: [mtime_ns, size] of the YAML file, as from _config_source.
+        
+        Returns:
+            The cached user configuration, or None if the cache is missing or stale.
+        """
+        if source is None:
+            return None
+        try:
+            with open(self._json_cache_path(), 'r') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cache, dict) or cache.get('source') != source:
+            return None
+        user_config = cache.get('config')
+        return user_config if isinstance(user_config, dict) else None
+    
+    def _write_json_cache(self, source: Optional[List[int]], user_config: Dict[str, Any]) -> None:
+        """Atomically write the parsed user configuration to the JSON sidecar cache.
+        
+        Args:
+            source: [mtime_ns, size] of the YAML file the configuration was parsed from.
+            user_config: Configuration values parsed from the YAML file.
+        """
+        if source is None:
+            return
+        cache_path = self._json_cache_path()
+        tmp_path = None
+        try:
+            data = json.dumps({'source': source, 'config': user_config})
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(cache_path)),
+                                            prefix='.config.', suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                f.write(data)
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError):
+            # Values that JSON can't represent or an unwritable directory just disable the cache
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
     
     def save(self, config_path: Optional[str] = None) -> None:
         """Save current configuration to a YAML file.
@@ -75,7 +214,7 @@ class Config:
         try:
             os.makedirs(os.path.dirname(os.path.abspath(self.config_path)), exist_ok=True)
             with open(self.config_path, 'w') as f:
-                yaml.dump(self._config, f, default_flow_style=False)
+                yaml.dump(self._config, f, Dumper=_YAML_DUMPER, default_flow_style=False)
         except Exception as e:
             print(f"Error saving config file: {e}")
     
@@ -100,6 +239,7 @@ class Config:
         """
         if key in self.DEFAULTS:
             self._config[key] = value
+            self._refresh_view()
     
     def parse_display_time(self, time_str: str) -> int:
         """Parse a time string with units into milliseconds.
@@ -110,6 +250,12 @@ class Config:
         Returns:
             Time in milliseconds.
         """
+        return self._parse_time_ms(str(time_str))
+    
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _parse_time_ms(time_str: str) -> int:
+        """Parse a time string into milliseconds, memoized by the raw string."""
         time_str = time_str.lower().strip()
         if time_str.endswith('s'):
             return int(float(time_str[:-1]) * 1000)
@@ -133,7 +279,7 @@ class Config:
     
     def check_font(self) -> ImageFont:
         try:
-            return ImageFont.truetype(self._config['metadata_font'], self._config['metadata_point_size'])
+            return _load_truetype(self._config['metadata_font'], self._config['metadata_point_size'])
         except Exception as e:
             print(f"Error loading font: {e}")
             return ImageFont.load_default()
@@ -151,3 +297,27 @@ class Config:
         for key, value in new_config.items():
             if key in self._config:
                 self._config[key] = value
+        self._refresh_view()
+    
+    def _refresh_view(self) -> None:
+        """Rebuild the attribute-access snapshot of the configuration.
+        
+        Hot paths read settings as `config.view.<key>` instead of calling get().
+        The snapshot is replaced, never mutated, whenever the configuration changes.
+        """
+        self.view = types.SimpleNamespace(**{k: v for k, v in self._config.items() if isinstance(k, str)})
+        
+        # Translate the clock format only when it changes, not on every clock tick
+        clock_format = self._config.get('clock_format')
+        if clock_format != self._clock_format:
+            self._clock_format = clock_format
+            self._clock_strftime_format = (arrow_to_strftime(clock_format)
+                                           if isinstance(clock_format, str) else None)
+    
+    def get_clock_strftime_format(self) -> Optional[str]:
+        """Get the clock format translated to strftime.
+        
+        Returns:
+            The strftime format, or None if the clock format needs Arrow to render.
+        """
+        return self._clock_strftime_format
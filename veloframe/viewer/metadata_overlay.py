@@ -1,30 +1,90 @@
 """
 Manages metadata overlays for photos.
 """
+from typing import NamedTuple
+
 from PySide6.QtGui import QFont, QColor, QBrush
+from PySide6.QtWidgets import QGraphicsRectItem, QGraphicsTextItem
 from PySide6.QtCore import Qt
 
 from .photo_processing import get_capture_date_str
 
+
+class _OverlaySide(NamedTuple):
+    """Overlay items for one side of the display and how to align them."""
+    rect: QGraphicsRectItem
+    text: QGraphicsTextItem
+    x_factor: int  # 0 = align to the image's left edge, 1 = align to its right edge
+
+
+# x_factor of each side's overlay
+_X_FACTORS = {"left": 0, "right": 1}
+
+# Which sides each hide_overlay position refers to
+_HIDE_SIDES = {
+    "left": ("left",),
+    "right": ("right",),
+    "both": ("left", "right"),
+}
+
 class MetadataManager:
     """Manages metadata overlays for photos."""
     
-    def __init__(self, scene, config):
+    __slots__ = (
+        'config', '_font_key', '_font', '_brush_key', '_brush',
+        '_applied_font_keys', '_applied_brushes', '_sides_owner', '_sides',
+    )
+    
+    def __init__(self, config):
         """Initialize the metadata manager.
         
         Args:
-            scene: The QGraphicsScene instance
             config: Configuration object
         """
-        self.scene = scene
         self.config = config
+        
+        # Cached Qt objects, rebuilt only when the settings they depend on change
+        self._font_key = None
+        self._font = None
+        self._brush_key = None
+        self._brush = None
+        
+        # Font key last applied to each overlay's text item, and background brush
+        # last applied to each overlay's rect (None while that overlay is hidden)
+        self._applied_font_keys = {"left": None, "right": None}
+        self._applied_brushes = {"left": None, "right": None}
+        
+        # Per-side overlay items, built on first use per UI components instance
+        self._sides_owner = None
+        self._sides = {}
+    
+    def _get_side(self, ui_components, position):
+        """Get the overlay items of one side for the given UI components.
+        
+        Args:
+            ui_components: UIComponentManager instance
+            position: "left" or "right"
+            
+        Returns:
+            The side's _OverlaySide, whose items are created on first use
+        """
+        if ui_components is not self._sides_owner:
+            self._sides = {}
+            self._sides_owner = ui_components
+            self._applied_font_keys = {"left": None, "right": None}
+            self._applied_brushes = {"left": None, "right": None}
+        side = self._sides.get(position)
+        if side is None:
+            rect, text = ui_components.metadata_items(position)
+            side = self._sides[position] = _OverlaySide(rect, text, _X_FACTORS[position])
+        return side
     
     def update_overlay(self, ui_components, exif, photo_path, pixmap, image_x, image_y, position="left"):
         """Update the metadata overlay with the capture date information.
         
         Args:
             ui_components: UIComponentManager instance
-            exif: EXIF data dictionary
+            exif: EXIF data (tag name -> value mapping)
             photo_path: Path to the current photo
             pixmap: The current photo pixmap
             image_x: X position of the image in the scene
@@ -32,25 +92,29 @@ class MetadataManager:
             position: Which overlay to update ("left" or "right")
         """
         # Select the appropriate overlay items based on position
-        if position == "left":
-            metadata_rect = ui_components.metadata_rect_left
-            metadata_text = ui_components.metadata_text_left
-        else:  # "right"
-            metadata_rect = ui_components.metadata_rect_right
-            metadata_text = ui_components.metadata_text_right
+        side = self._get_side(ui_components, position)
+        metadata_rect = side.rect
+        metadata_text = side.text
         
         # Get the capture date string
         date_str = get_capture_date_str(exif, photo_path)
         
-        # Configure font
-        font = QFont(self.config.get('metadata_font', 'Arial'))
-        font.setPointSize(self.config.get('metadata_point_size', 20))
-        metadata_text.setFont(font)
+        # Configure font, only touching the text item when the font actually changed
+        cfg = self.config.view
+        font_key = (cfg.metadata_font, cfg.metadata_point_size)
+        if font_key != self._font_key:
+            self._font = QFont(font_key[0])
+            self._font.setPointSize(font_key[1])
+            self._font_key = font_key
+        if self._applied_font_keys[position] != font_key:
+            metadata_text.setFont(self._font)
+            self._applied_font_keys[position] = font_key
         metadata_text.setPlainText(date_str)
         
         # Calculate text dimensions
-        text_width = metadata_text.boundingRect().width()
-        text_height = metadata_text.boundingRect().height()
+        text_rect = metadata_text.boundingRect()
+        text_width = text_rect.width()
+        text_height = text_rect.height()
         
         # Set padding
         padding = 5
@@ -63,17 +127,20 @@ class MetadataManager:
         rect_width = text_width + padding * 2
         rect_height = text_height + padding * 2
         
-        if position == "left":
-            # Position from bottom left of the image (18px from edges)
-            rect_x = image_x + edge_distance
-        else:  # "right"
-            # Position from bottom right of the image (18px from edges)
-            rect_x = image_x + pixmap.width() - text_width - padding * 2 - edge_distance
+        # Position from bottom left or bottom right of the image depending on the side
+        rect_x = image_x + edge_distance + side.x_factor * (pixmap.width() - rect_width - edge_distance * 2)
         
         # Configure rectangle
         metadata_rect.setRect(rect_x, rect_y, rect_width, rect_height)
-        opacity = self.config.get('metadata_opacity', 70)
-        metadata_rect.setBrush(QBrush(QColor(0, 0, 0, int(opacity * 2.55))))  # Convert 0-100 to 0-255
+        opacity = cfg.metadata_opacity
+        if opacity != self._brush_key:
+            self._brush = QBrush(QColor(0, 0, 0, int(opacity * 2.55)))  # Convert 0-100 to 0-255
+            self._brush_key = opacity
+        if self._applied_brushes[position] is not self._brush:
+            metadata_rect.setBrush(self._brush)
+            metadata_rect.setVisible(True)
+            metadata_text.setVisible(True)
+            self._applied_brushes[position] = self._brush
         
         # Position text
         metadata_text.setPos(rect_x + padding, rect_y + padding)
@@ -85,56 +152,46 @@ class MetadataManager:
             ui_components: UIComponentManager instance
             position: Which overlay to hide ("left", "right", or "both")
         """
-        if position in ["left", "both"]:
-            ui_components.metadata_rect_left.setBrush(QBrush(QColor(0, 0, 0, 0)))
-            ui_components.metadata_text_left.setPlainText("")
-        
-        if position in ["right", "both"]:
-            ui_components.metadata_rect_right.setBrush(QBrush(QColor(0, 0, 0, 0)))
-            ui_components.metadata_text_right.setPlainText("")
+        # Overlays of UI components this manager hasn't shown start out hidden
+        if ui_components is not self._sides_owner:
+            return
+        for side_key in _HIDE_SIDES[position]:
+            # Nothing to clear if this overlay is already hidden
+            if self._applied_brushes[side_key] is None:
+                continue
+            # Hidden items are skipped when painting, unlike a transparent brush
+            side = self._sides[side_key]
+            side.rect.setVisible(False)
+            side.text.setVisible(False)
+            side.text.setPlainText("")
+            self._applied_brushes[side_key] = None
     
     def update_for_photo_details(self, ui_components, photo_details):
         """Update metadata overlays based on photo details.
         
         Args:
             ui_components: UIComponentManager instance
-            photo_details: Dictionary with photo details
+            photo_details: PhotoDetails for the photo(s)
         """
-        # Hide all metadata first
-        self.hide_overlay(ui_components, "both")
-        
         # Skip if metadata is disabled
-        if not photo_details.get('show_metadata', False):
+        if not photo_details.show_metadata:
+            self.hide_overlay(ui_components, "both")
             return
             
-        if photo_details['mode'] == 'single':
-            # Update left metadata
-            self.update_overlay(
-                ui_components,
-                photo_details['exif'], 
-                photo_details['path'], 
-                photo_details['pixmap'], 
-                photo_details['image_x'], 
-                photo_details['image_y'], 
-                "left"
+        if photo_details.mode == 'single':
+            # Only the right overlay needs clearing; the left one is overwritten below
+            self.hide_overlay(ui_components, "right")
+            sides = (
+                ("left", photo_details.exif, photo_details.path, photo_details.pixmap,
+                 photo_details.image_x, photo_details.image_y),
             )
         else:  # 'pair'
-            # Update both left and right metadata
-            self.update_overlay(
-                ui_components,
-                photo_details['exif1'], 
-                photo_details['path1'], 
-                photo_details['pixmap1'], 
-                photo_details['image1_x'], 
-                photo_details['image1_y'], 
-                "left"
-            )
-            self.update_overlay(
-                ui_components,
-                photo_details['exif2'], 
-                photo_details['path2'], 
-                photo_details['pixmap2'], 
-                photo_details['image2_x'], 
-                photo_details['image2_y'], 
-                "right"
+            sides = (
+                ("left", photo_details.exif1, photo_details.path1, photo_details.pixmap1,
+                 photo_details.image1_x, photo_details.image1_y),
+                ("right", photo_details.exif2, photo_details.path2, photo_details.pixmap2,
+                 photo_details.image2_x, photo_details.image2_y),
             )
+        
+        for position, exif, photo_path, pixmap, image_x, image_y in sides:
+            self.update_overlay(ui_components, exif, photo_path, pixmap, image_x, image_y, position)
@@ -1,6 +1,9 @@
 """
 Core functionality for the photo display system.
 """
+import gc
+import logging
+
 from PySide6.QtGui import QPixmap
 
 from .photo_ui_components import UIComponentManager
@@ -9,9 +12,24 @@ from .photo_preparation import PhotoPreparationManager
 from .metadata_overlay import MetadataManager
 from .clock_overlay import ClockManager
 
+logger = logging.getLogger(__name__)
+
 class PhotoDisplay:
     """Core display functionality for the photo frame application."""
     
+    __slots__ = (
+        'scene', 'config', 'ui_manager', 'photo_prep_manager', 'metadata_manager',
+        'clock_manager', 'transition_manager', 'current_photo_details',
+        'next_photo_details', 'in_transition', '_mid_swap_done',
+    )
+    
+    # Generation-0 GC threshold for the slideshow process. Photo changes allocate
+    # many short-lived containers; a higher threshold avoids frequent collections.
+    GC_THRESHOLD_GEN0 = 50000
+    _gc_tuned = False
+    _gc_frozen = False
+    _gc_paused = False
+    
     def __init__(self, scene, config):
         """Initialize the PhotoDisplay with the necessary UI components.
         
@@ -25,7 +43,7 @@ class PhotoDisplay:
         # Initialize component managers
         self.ui_manager = UIComponentManager(scene)
         self.photo_prep_manager = PhotoPreparationManager(config)
-        self.metadata_manager = MetadataManager(scene, config)
+        self.metadata_manager = MetadataManager(config)
         self.clock_manager = ClockManager(scene, config)
         self.transition_manager = TransitionManager(self.ui_manager, config)
         
@@ -36,10 +54,170 @@ class PhotoDisplay:
         self.transition_manager.set_update_metadata_callback(self._update_metadata_mid_transition)
         
         # Track state
-        self.current_mode = "single"  # "single" or "pair"
         self.current_photo_details = None
         self.next_photo_details = None
         self.in_transition = False
+        self._mid_swap_done = False  # Whether the mid-transition metadata swap has run
+        
+        # Tune the garbage collector once per process rather than forcing collections
+        if not PhotoDisplay._gc_tuned:
+            gen0, _, _ = gc.get_threshold()
+            gc.set_threshold(max(gen0, self.GC_THRESHOLD_GEN0), 30, 30)
+            PhotoDisplay._gc_tuned = True
+        
+        # The managers created above live for the whole application, so move them
+        # (and everything else alive at startup) out of the GC's reach. Pixmaps and
+        # photo details allocated later stay in the normal generations.
+        if not PhotoDisplay._gc_frozen:
+            gc.collect()
+            gc.freeze()
+            PhotoDisplay._gc_frozen = True
+    
+    @staticmethod
+    def unfreeze_gc():
+        """Return objects frozen at startup to the normal GC generations."""
+        gc.unfreeze()
+        PhotoDisplay._gc_frozen = False
+    
+    @staticmethod
+    def _pause_gc():
+        """Keep cyclic garbage collection from pausing a running transition."""
+        if not PhotoDisplay._gc_paused and gc.isenabled():
+            gc.disable()
+            PhotoDisplay._gc_paused = True
+    
+    @staticmethod
+    def _resume_gc():
+        """Re-enable garbage collection after a transition, collecting only the youngest generation."""
+        if PhotoDisplay._gc_paused:
+            PhotoDisplay._gc_paused = False
+            gc.enable()
+            gc.collect(0)
+    
+    def prepare_single_photo(self, photo_path, screen_size, apply_blur, show_metadata):
+        """Prepare a single photo for display, reusing its cached pixmap if available.
+        
+        Args:
+            photo_path: Path to the photo
+            screen_size: (width, height) tuple
+            apply_blur: Whether to apply blur effect
+            show_metadata: Whether to show metadata overlay
+        
+        Returns:
+            PhotoDetails for the photo
+        """
+        return self.photo_prep_manager.prepare_single_photo(photo_path, screen_size, apply_blur, show_metadata)
+    
+    def prepare_photo_pair(self, photo1_path, photo2_path, screen_size, apply_blur, show_metadata):
+        """Prepare a pair of photos for display, reusing their cached pixmaps if available.
+        
+        Args:
+            photo1_path: Path to the first photo
+            photo2_path: Path to the second photo
+            screen_size: (width, height) tuple
+            apply_blur: Whether to apply blur effect
+            show_metadata: Whether to show metadata overlay
+        
+        Returns:
+            PhotoDetails for the photo pair
+        """
+        return self.photo_prep_manager.prepare_photo_pair(
+            photo1_path, photo2_path, screen_size, apply_blur, show_metadata
+        )
+    
+    def prefetch_single_photo(self, photo_path, screen_size, apply_blur, show_metadata):
+        """Start decoding a single photo in the background unless it's already cached.
+        
+        Args:
+            photo_path: Path to the photo
+            screen_size: (width, height) tuple
+            apply_blur: Whether to apply blur effect
+            show_metadata: Whether to show metadata overlay
+        """
+        self.photo_prep_manager.prefetch_single_photo(photo_path, screen_size, apply_blur)
+    
+    def prefetch_photo_pair(self, photo1_path, photo2_path, screen_size, apply_blur, show_metadata):
+        """Start decoding a pair of photos in the background unless they're already cached.
+        
+        Args:
+            photo1_path: Path to the first photo
+            photo2_path: Path to the second photo
+            screen_size: (width, height) tuple
+            apply_blur: Whether to apply blur effect
+            show_metadata: Whether to show metadata overlay
+        """
+        self.photo_prep_manager.prefetch_photo_pair(photo1_path, photo2_path, screen_size, apply_blur)
+    
+    def is_single_photo_ready(self, photo_path, screen_size, apply_blur, show_metadata):
+        """Check whether a single photo can be prepared without decoding it now.
+        
+        Args:
+            photo_path: Path to the photo
+            screen_size: (width, height) tuple
+            apply_blur: Whether to apply blur effect
+            show_metadata: Whether to show metadata overlay
+        
+        Returns:
+            True if the photo is cached or its prefetch has finished
+        """
+        return self.photo_prep_manager.is_single_photo_ready(photo_path, screen_size, apply_blur)
+    
+    def prepare_single_preview(self, photo_path, screen_size, apply_blur, show_metadata):
+        """Prepare a stand-in for a single photo from its embedded EXIF thumbnail.
+        
+        Args:
+            photo_path: Path to the photo
+            screen_size: (width, height) tuple
+            apply_blur: Whether to apply blur effect
+            show_metadata: Whether to show metadata overlay
+        
+        Returns:
+            PhotoDetails with is_preview set, or None if the photo has no thumbnail
+        """
+        return self.photo_prep_manager.prepare_single_preview(photo_path, screen_size, apply_blur, show_metadata)
+    
+    def release_preview(self):
+        """Stop holding on to the decode of a previewed photo, e.g. when its slide is over."""
+        self.photo_prep_manager.release_preview()
+    
+    def replace_preview(self):
+        """Swap a shown EXIF thumbnail preview for the full photo once it's decoded.
+        
+        Returns:
+            True if there's no preview left to replace, False to check again later
+        
+        Raises:
+            Exception: The full photo failed to load; the caller should skip it
+        """
+        preview = self.next_photo_details if self.in_transition else self.current_photo_details
+        if preview is None or not preview.is_preview:
+            return True
+        if not self.photo_prep_manager.is_single_photo_ready(preview.path, preview.screen_size, preview.apply_blur):
+            return False
+        
+        try:
+            photo_details = self.prepare_single_photo(
+                preview.path, preview.screen_size, preview.apply_blur, preview.show_metadata
+            )
+        except Exception as e:
+            logger.error("Error loading the full photo for preview %s: %s", preview.path, e)
+            raise
+        
+        self.ui_manager.set_single_photo(
+            not self.in_transition,
+            photo_details.pixmap,
+            photo_details.image_x,
+            photo_details.image_y
+        )
+        if self.in_transition:
+            self.next_photo_details = photo_details
+            if not self._mid_swap_done:
+                # The metadata swap later in the transition will pick it up
+                return True
+        else:
+            self.current_photo_details = photo_details
+        self.metadata_manager.update_for_photo_details(self.ui_manager, photo_details)
+        return True
     
     def show_single_photo(self, photo_path, screen_size, apply_blur, show_metadata):
         """Display a single photo.
@@ -50,7 +228,7 @@ class PhotoDisplay:
             apply_blur: Whether to apply blur effect
             show_metadata: Whether to show metadata overlay
         """
-        photo_details = self.photo_prep_manager.prepare_single_photo(
+        photo_details = self.prepare_single_photo(
             photo_path, screen_size, apply_blur, show_metadata
         )
         self._display_photo_immediately(photo_details)
@@ -65,11 +243,39 @@ class PhotoDisplay:
             apply_blur: Whether to apply blur effect
             show_metadata: Whether to show metadata overlay
         """
-        photo_details = self.photo_prep_manager.prepare_photo_pair(
+        photo_details = self.prepare_photo_pair(
             photo1_path, photo2_path, screen_size, apply_blur, show_metadata
         )
         self._display_photo_immediately(photo_details)
     
+    def redisplay(self, screen_size):
+        """Show the current photo(s) again at a new screen size, e.g. after a resize.
+        
+        A running transition is cut short and its target shown directly.
+        
+        Args:
+            screen_size: (width, height) tuple
+        """
+        photo_details = self.current_photo_details
+        if self.in_transition:
+            self.transition_manager.cancel_transition()
+            photo_details = self.next_photo_details or photo_details
+            self.next_photo_details = None
+            self.in_transition = False
+            self._mid_swap_done = False
+        if photo_details is None:
+            return
+        
+        if photo_details.mode == 'single':
+            self.show_single_photo(
+                photo_details.path, screen_size, photo_details.apply_blur, photo_details.show_metadata
+            )
+        else:  # 'pair'
+            self.show_photo_pair(
+                photo_details.path1, photo_details.path2, screen_size,
+                photo_details.apply_blur, photo_details.show_metadata
+            )
+    
     def start_photo_transition(self, next_photo_details, duration=None):
         """Start transition to the next photo with a cross-dissolve effect.
         
@@ -91,6 +297,8 @@ class PhotoDisplay:
         # Store state
         self.next_photo_details = next_photo_details
         self.in_transition = True
+        self._mid_swap_done = False
+        self._pause_gc()
         
         # Delegate to transition manager
         self.transition_manager.start_transition(
@@ -104,81 +312,44 @@ class PhotoDisplay:
         """Display photo(s) immediately without transition.
         
         Args:
-            photo_details: Dictionary with photo details
+            photo_details: PhotoDetails for the photo(s)
         """
+        # A running transition would keep fading the layers over this photo
+        if self.in_transition:
+            self.transition_manager.cancel_transition()
+        
         # Reset the scene rectangle
-        screen_size = photo_details['screen_size']
+        screen_size = photo_details.screen_size
         self.ui_manager.set_scene_rect(screen_size[0], screen_size[1])
         
         # Clear next images
         self.ui_manager.clear_next_photos()
         
-        if photo_details['mode'] == 'single':
+        if photo_details.mode == 'single':
             # Set the single photo
             self.ui_manager.set_single_photo(
                 True,  # current
-                photo_details['pixmap'],
-                photo_details['image_x'],
-                photo_details['image_y']
+                photo_details.pixmap,
+                photo_details.image_x,
+                photo_details.image_y
             )
-            
-            # Update or hide metadata
-            if photo_details['show_metadata']:
-                self.metadata_manager.update_overlay(
-                    self.ui_manager,
-                    photo_details['exif'], 
-                    photo_details['path'], 
-                    photo_details['pixmap'], 
-                    photo_details['image_x'], 
-                    photo_details['image_y'], 
-                    "left"
-                )
-                # Hide right metadata
-                self.metadata_manager.hide_overlay(self.ui_manager, "right")
-            else:
-                # Hide all metadata
-                self.metadata_manager.hide_overlay(self.ui_manager, "both")
         else:  # 'pair'
             # Set the photo pair
             self.ui_manager.set_photo_pair(
                 True,  # current
-                photo_details['pixmap1'],
-                photo_details['image1_x'],
-                photo_details['image1_y'],
-                photo_details['pixmap2'],
-                photo_details['image2_x'],
-                photo_details['image2_y']
+                photo_details.pixmap1,
+                photo_details.image1_x,
+                photo_details.image1_y,
+                photo_details.pixmap2,
+                photo_details.image2_x,
+                photo_details.image2_y
             )
-            
-            # Update or hide metadata
-            if photo_details['show_metadata']:
-                self.metadata_manager.update_overlay(
-                    self.ui_manager,
-                    photo_details['exif1'], 
-                    photo_details['path1'], 
-                    photo_details['pixmap1'], 
-                    photo_details['image1_x'], 
-                    photo_details['image1_y'], 
-                    "left"
-                )
-                self.metadata_manager.update_overlay(
-                    self.ui_manager,
-                    photo_details['exif2'], 
-                    photo_details['path2'], 
-                    photo_details['pixmap2'], 
-                    photo_details['image2_x'], 
-                    photo_details['image2_y'], 
-                    "right"
-                )
-            else:
-                # Hide metadata
-                self.metadata_manager.hide_overlay(self.ui_manager, "both")
+        
+        # Update or hide metadata for the photo(s)
+        self.metadata_manager.update_for_photo_details(self.ui_manager, photo_details)
         
         # Reset opacities
-        self.ui_manager.set_opacity("current", "left", 1.0)
-        self.ui_manager.set_opacity("current", "right", 1.0)
-        self.ui_manager.set_opacity("next", "left", 0.0)
-        self.ui_manager.set_opacity("next", "right", 0.0)
+        self.ui_manager.reset_opacities(1.0, 0.0)
         
         # Show clock if enabled
         self.clock_manager.show_overlay()
@@ -187,6 +358,7 @@ class PhotoDisplay:
         self.current_photo_details = photo_details
         self.next_photo_details = None
         self.in_transition = False
+        self._resume_gc()
     
     def _update_metadata_mid_transition(self, value):
         """Update metadata overlays at the middle of the transition.
@@ -194,13 +366,14 @@ class PhotoDisplay:
         Args:
             value: Current opacity value (0.0-1.0) of the animation
         """
-        # Only update metadata near the middle of the transition (around 0.45-0.55 opacity)
-        if 0.45 <= value <= 0.55 and self.next_photo_details:
-            # Hide all existing metadata first
-            self.metadata_manager.hide_overlay(self.ui_manager, "both")
-            
-            # Update metadata for the new photo(s)
-            self.metadata_manager.update_for_photo_details(self.ui_manager, self.next_photo_details)
+        # Only update metadata once, on the first tick at or past the middle of the
+        # transition, so a dropped frame around 0.5 can't skip the swap entirely
+        if self._mid_swap_done or value < 0.5 or not self.next_photo_details:
+            return
+        self._mid_swap_done = True
+        
+        # Update metadata for the new photo(s), hiding overlays that are no longer needed
+        self.metadata_manager.update_for_photo_details(self.ui_manager, self.next_photo_details)
     
     def _finalize_transition(self):
         """Finalize the transition by updating current photo details and swapping layers."""
@@ -208,7 +381,7 @@ class PhotoDisplay:
             return
             
         # Swap layers in UI manager
-        self.ui_manager.swap_layers(self.next_photo_details['mode'])
+        self.ui_manager.swap_layers(self.next_photo_details.mode)
         
         # Update current photo details
         self.current_photo_details = self.next_photo_details
@@ -216,6 +389,8 @@ class PhotoDisplay:
         
         # Reset transition state
         self.in_transition = False
+        self._mid_swap_done = False
+        self._resume_gc()
         
         # Show clock if enabled
         self.clock_manager.show_overlay()
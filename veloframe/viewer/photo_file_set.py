@@ -1,15 +1,78 @@
 import os
+import json
 import random
+import tempfile
 import threading
+from bisect import bisect_right, insort
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Optional, Tuple, Set, Dict
 
-from .photo_processing import is_portrait
+from .photo_processing import is_portrait, clear_capture_date_cache, clear_exif_cache
+
+# Supported image file extensions
+SUPPORTED_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.bmp', '.gif', '.tiff', '.webp'})
+
+
+@lru_cache(maxsize=256)
+def _is_supported_suffix(suffix: str) -> bool:
+    """Check whether a file suffix (including the dot) is a supported image type.
+    
+    Photo trees only use a handful of distinct suffixes, so memoizing per suffix
+    avoids lowercasing a copy of it for every file scanned.
+    
+    Args:
+        suffix: File suffix as found on disk, e.g. ".JPG"
+        
+    Returns:
+        True if the suffix is a supported image extension
+    """
+    return suffix.lower() in SUPPORTED_EXTENSIONS
+
+
+def _scan_directory(directory: str) -> Tuple[List[str], List[str]]:
+    """List the supported photos and the subdirectories of one directory.
+    
+    Args:
+        directory: Directory to list
+        
+    Returns:
+        Tuple of (photo paths, subdirectory paths); both empty if the directory can't be read
+    """
+    files = []
+    subdirs = []
+    is_supported = _is_supported_suffix
+    try:
+        # DirEntry caches the file type so most entries need no extra stat call
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir():
+                    # Like os.walk, don't descend into symlinked directories
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                else:
+                    dot = name.rfind('.')
+                    if dot >= 0 and is_supported(name[dot:]):
+                        files.append(entry.path)
+    except OSError:
+        return [], []
+    return files, subdirs
+
 
 class PhotoFileSet:
     """Handles all photo-related operations for the photo frame application."""
     
     # Supported image file extensions
-    SUPPORTED_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp', '.gif', '.tiff', '.webp')
+    SUPPORTED_EXTENSIONS = SUPPORTED_EXTENSIONS
+    
+    # Maximum number of directories listed concurrently while scanning
+    SCAN_WORKERS = 8
+    
+    # Portrait detection results persisted across runs, keyed by path, mtime and size
+    PORTRAIT_CACHE_PATH = os.path.join(
+        os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'veloframe', 'portrait.json'
+    )
     
     def __init__(self, photos_directory: str, random_order: bool = False):
         """Initialize the photo manager.
@@ -24,13 +87,12 @@ class PhotoFileSet:
         self.current_index = 0
         
         # Portrait photo tracking
-        self.portrait_photos = set()
-        self.portrait_cache: Dict[str, bool] = {}  # Cache for portrait detection results
-        self.portrait_scan_complete = False
-        self.portrait_scan_lock = threading.Lock()
+        # Photo path -> whether it's portrait; a missing path means not checked yet.
+        # Plain dict reads/writes are atomic under the GIL, so no lock is needed.
+        self._orientation: Dict[str, bool] = {}
+        self._disk_portrait_cache: Optional[Dict[str, list]] = None  # Loaded by the background scan
         
-        if random_order and self.photo_files:
-            random.shuffle(self.photo_files)
+        self._rebuild_index()
             
         # Start portrait scanning in background thread
         self._start_background_portrait_scan()
@@ -38,6 +100,8 @@ class PhotoFileSet:
     def _get_photo_files(self) -> List[str]:
         """Get all photo files from the photos directory and subdirectories.
         
+        The list is shuffled when random_order is set.
+        
         Returns:
             List of absolute paths to photo files
         """
@@ -47,13 +111,55 @@ class PhotoFileSet:
             print(f"Warning: Photos directory '{self.photos_directory}' does not exist")
             return photo_files
             
-        for root, _, files in os.walk(self.photos_directory):
-            for file in files:
-                if file.lower().endswith(self.SUPPORTED_EXTENSIONS):
-                    photo_files.append(os.path.join(root, file))
+        # Read the tree one level at a time; directories on the same level are
+        # listed concurrently, which helps most on network mounts where each
+        # readdir is a round trip
+        root = self.photos_directory
+        listings = {root: _scan_directory(root)}
+        level = listings[root][1]
+        if level:
+            with ThreadPoolExecutor(max_workers=self.SCAN_WORKERS, thread_name_prefix="PhotoScan") as executor:
+                while level:
+                    next_level = []
+                    for directory, listing in zip(level, executor.map(_scan_directory, level)):
+                        listings[directory] = listing
+                        next_level.extend(listing[1])
+                    level = next_level
+        
+        # Stitch the listings together in the same top-down order as os.walk
+        stack = [root]
+        while stack:
+            files, subdirs = listings[stack.pop()]
+            photo_files.extend(files)
+            stack.extend(reversed(subdirs))
+        
+        # Shuffle in place while the freshly built list is still hot in cache
+        if self.random_order:
+            random.shuffle(photo_files)
         
         return photo_files
     
+    def _rebuild_index(self):
+        """Rebuild the path -> position lookup after photo_files changes."""
+        self._index_of: Dict[str, int] = {path: i for i, path in enumerate(self.photo_files)}
+        self._rebuild_portrait_indices()
+    
+    def _rebuild_portrait_indices(self):
+        """Rebuild the sorted positions of known portrait photos.
+        
+        The list is only complete once every photo's orientation is known; until
+        then find_portrait_pair falls back to checking photos one by one.
+        
+        This runs on the background scan thread too, so the flag and the list
+        are published together as one tuple; readers never see a complete flag
+        paired with an outdated list.
+        """
+        orientation = self._orientation
+        photo_files = self.photo_files
+        complete = all(path in orientation for path in photo_files)
+        indices = [i for i, path in enumerate(photo_files) if orientation.get(path)]
+        self._portrait_index: Tuple[bool, List[int]] = (complete, indices)
+    
     def _start_background_portrait_scan(self):
         """Start scanning for portrait photos in a background thread."""
         if not self.photo_files:
@@ -68,39 +174,96 @@ class PhotoFileSet:
         scan_thread.start()
     
     def _background_portrait_scan(self):
-        """Background thread function to scan all photos for portrait orientation."""
+        """Background thread function to scan all photos for portrait orientation.
+        
+        Only image headers are read, so the work is I/O bound and the checks are
+        spread over a small thread pool to keep several reads in flight.
+        """
         try:
-            with self.portrait_scan_lock:
-                self.portrait_scan_complete = False
-                self.portrait_photos = set()
-                
-                # Process photos in batches to avoid blocking for too long
-                batch_size = 20
-                for i in range(0, len(self.photo_files), batch_size):
-                    batch = self.photo_files[i:i+batch_size]
-                    for photo_path in batch:
-                        try:
-                            # Check if we already have this in the cache
-                            if photo_path in self.portrait_cache:
-                                is_portrait_photo = self.portrait_cache[photo_path]
-                            else:
-                                # Detect portrait orientation and cache the result
-                                is_portrait_photo = is_portrait(photo_path)
-                                self.portrait_cache[photo_path] = is_portrait_photo
-                                
-                            # Add to portrait set if it's a portrait photo
-                            if is_portrait_photo:
-                                self.portrait_photos.add(photo_path)
-                        except Exception as e:
-                            print(f"Error checking if {photo_path} is portrait: {e}")
-                
-                self.portrait_scan_complete = True
-                print(f"Portrait scan complete. Found {len(self.portrait_photos)} portrait photos.")
+            # Snapshot the list in case a rescan replaces it while we're working
+            photo_files = list(self.photo_files)
+            
+            if self._disk_portrait_cache is None:
+                self._disk_portrait_cache = self._load_portrait_disk_cache()
+            disk_cache = self._disk_portrait_cache
+            
+            # Only probe photos we haven't seen before
+            orientation = self._orientation
+            to_scan = [path for path in photo_files if path not in orientation]
+            
+            def check(photo_path):
+                # Photos whose mtime and size match the disk cache don't need opening
+                try:
+                    st = os.stat(photo_path)
+                except OSError:
+                    return None, is_portrait(photo_path)
+                stat_key = [st.st_mtime_ns, st.st_size]
+                cached = disk_cache.get(photo_path)
+                if cached is not None and cached[:2] == stat_key:
+                    return cached, cached[2]
+                result = is_portrait(photo_path)
+                return stat_key + [result], result
+            
+            max_workers = min(8, (os.cpu_count() or 2) * 2)
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="PortraitScan") as executor:
+                for photo_path, (entry, is_portrait_photo) in zip(to_scan, executor.map(check, to_scan)):
+                    # Keep any result an on-demand check recorded in the meantime
+                    orientation.setdefault(photo_path, is_portrait_photo)
+                    if entry is not None:
+                        disk_cache[photo_path] = entry
+            
+            self._rebuild_portrait_indices()
+            self._save_portrait_disk_cache(photo_files)
+            portrait_count = sum(1 for path in photo_files if orientation.get(path))
+            print(f"Portrait scan complete. Found {portrait_count} portrait photos.")
         except Exception as e:
             print(f"Error in background portrait scan: {e}")
-            # Ensure we mark the scan as complete even if there was an error
-            with self.portrait_scan_lock:
-                self.portrait_scan_complete = True
+    
+    def _load_portrait_disk_cache(self) -> Dict[str, list]:
+        """Load persisted portrait detection results.
+        
+        Returns:
+            Dictionary mapping photo path to [mtime_ns, size, is_portrait]
+        """
+        try:
+            with open(self.PORTRAIT_CACHE_PATH, 'r') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+    
+    def _save_portrait_disk_cache(self, photo_files: List[str]):
+        """Atomically persist portrait detection results.
+        
+        Entries for the scanned photos are kept, along with entries from other
+        photo directories whose files still exist, so the cache can't grow unbounded.
+        
+        Args:
+            photo_files: Photos covered by the scan that just completed
+        """
+        disk_cache = self._disk_portrait_cache
+        current = set(photo_files)
+        root = os.path.join(self.photos_directory, '')
+        entries = {
+            path: entry for path, entry in disk_cache.items()
+            if path in current or (not path.startswith(root) and os.path.exists(path))
+        }
+        
+        tmp_path = None
+        try:
+            cache_dir = os.path.dirname(self.PORTRAIT_CACHE_PATH)
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix='.portrait.', suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.PORTRAIT_CACHE_PATH)
+        except OSError as e:
+            print(f"Error saving portrait cache: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def __len__(self) -> int:
+        return len(self.photo_files)
     
     def has_photos(self) -> bool:
         """Check if there are any photos available.
@@ -132,15 +295,14 @@ class PhotoFileSet:
         """Rescan the photos directory for new photos."""
         current_file = self.get_current_photo_path()
         self.photo_files = self._get_photo_files()
-        
-        if self.random_order and self.photo_files:
-            random.shuffle(self.photo_files)
+        self._rebuild_index()
             
         # Try to keep the current photo if it still exists
-        if current_file and current_file in self.photo_files:
-            self.current_index = self.photo_files.index(current_file)
-        else:
-            self.current_index = 0
+        self.current_index = self._index_of.get(current_file, 0) if current_file else 0
+            
+        # Drop capture dates and EXIF data memoized for the previous scan
+        clear_capture_date_cache()
+        clear_exif_cache()
             
         # Restart portrait scanning
         self._start_background_portrait_scan()
@@ -148,7 +310,7 @@ class PhotoFileSet:
     def is_portrait_photo(self, photo_path: str) -> bool:
         """Check if a photo is portrait-oriented (height > width).
         
-        This method first checks the cache and portrait set from the background scan.
+        This method uses the result from the background scan when available.
         If the photo hasn't been scanned yet, it performs an on-demand check.
         
         Args:
@@ -157,33 +319,18 @@ class PhotoFileSet:
         Returns:
             True if the photo is portrait-oriented, False otherwise
         """
-        # First check if the photo is in our portrait set from the background scan
-        if photo_path in self.portrait_photos:
-            return True
-            
-        # If the scan is complete and the photo isn't in the set, it's not portrait
-        if self.portrait_scan_complete and photo_path in self.portrait_cache:
-            return False
+        is_portrait_photo = self._orientation.get(photo_path)
+        if is_portrait_photo is not None:
+            return is_portrait_photo
             
         # If we don't have a result yet, check on demand and cache the result
-        try:
-            with self.portrait_scan_lock:
-                # Double-check in case another thread updated while we were waiting
-                if photo_path in self.portrait_cache:
-                    is_portrait_photo = self.portrait_cache[photo_path]
-                else:
-                    # Detect portrait orientation and cache the result
-                    is_portrait_photo = is_portrait(photo_path)
-                    self.portrait_cache[photo_path] = is_portrait_photo
-                    
-                    # Add to portrait set if it's a portrait photo
-                    if is_portrait_photo:
-                        self.portrait_photos.add(photo_path)
-                        
-                return is_portrait_photo
-        except Exception as e:
-            print(f"Error checking if {photo_path} is portrait: {e}")
-            return False
+        is_portrait_photo = is_portrait(photo_path)
+        self._orientation[photo_path] = is_portrait_photo
+        if is_portrait_photo:
+            index = self._index_of.get(photo_path)
+            if index is not None:
+                insort(self._portrait_index[1], index)
+        return is_portrait_photo
     
     def find_portrait_pair(self, current_photo: str, lookahead: int = 10) -> Tuple[bool, Optional[str]]:
         """Find a portrait photo to pair with the current one
@@ -200,30 +347,81 @@ class PhotoFileSet:
             - should_pair: True if a portrait photo was found to pair with
             - next_portrait_photo: Path to the portrait photo to pair with, or None
         """
+        offset, next_photo = self._find_portrait_partner(current_photo, lookahead)
+        if next_photo is None:
+            return False, None
+        
+        # We'll skip ahead to pair these photos
+        # Need to update the current index
+        if offset > 1:
+            # Move to the photo before the one we're pairing with
+            self.current_index = (self._index_of[current_photo] + offset - 1) % len(self.photo_files)
+        return True, next_photo
+    
+    def peek_next_photos(self, lookahead: int = 10) -> Tuple[Optional[str], Optional[str]]:
+        """Get the photo(s) the next call to next_photo will lead to, without moving.
+        
+        Args:
+            lookahead: Number of photos to look ahead for a portrait match
+            
+        Returns:
+            Tuple of (next_photo, portrait_partner); portrait_partner is None
+            when the next photo will be shown on its own
+        """
+        if not self.photo_files:
+            return None, None
+        next_photo = self.photo_files[(self.current_index + 1) % len(self.photo_files)]
+        return next_photo, self._find_portrait_partner(next_photo, lookahead)[1]
+    
+    def _find_portrait_partner(self, current_photo: str, lookahead: int) -> Tuple[int, Optional[str]]:
+        """Find the portrait photo that would be paired with the current one.
+        
+        Args:
+            current_photo: Path to the current photo
+            lookahead: Number of photos to look ahead for a portrait match
+            
+        Returns:
+            Tuple of (offset from the current photo, portrait photo path), or
+            (0, None) if the current photo shouldn't be paired
+        """
         # Must be a portrait photo
         if not self.is_portrait_photo(current_photo):
-            return False, None
+            return 0, None
             
         # Get the current photo's index
-        try:
-            current_index = self.photo_files.index(current_photo)
-        except ValueError:
+        current_index = self._index_of.get(current_photo)
+        if current_index is None:
             # Photo might have been removed
-            return False, None
+            return 0, None
         
-        # Look ahead for portrait photos
-        for i in range(1, min(lookahead + 1, len(self.photo_files))):
-            next_index = (current_index + i) % len(self.photo_files)
+        num_photos = len(self.photo_files)
+        window = min(lookahead + 1, num_photos)
+        
+        # Read the flag and the list in one go; the scan thread may replace them
+        indices_complete, portrait_indices = self._portrait_index
+        if indices_complete and portrait_indices:
+            # Every orientation is known: jump straight to the next portrait (wrapping around)
+            k = bisect_right(portrait_indices, current_index)
+            next_index = portrait_indices[k if k < len(portrait_indices) else 0]
+            i = (next_index - current_index) % num_photos
+            if not 0 < i < window:
+                # No portrait photo found in the lookahead window
+                return 0, None
             next_photo = self.photo_files[next_index]
-            
-            # Check if this photo is portrait
-            if self.is_portrait_photo(next_photo):
-                # We'll skip ahead to pair these photos
-                # Need to update the current index
-                if i > 1:
-                    # Move to the photo before the one we're pairing with
-                    self.current_index = (current_index + i - 1) % len(self.photo_files)
-                return True, next_photo
-        
-        # No portrait photo found in the lookahead window
-        return False, None
+        else:
+            # Scan still running: look ahead for portrait photos one by one,
+            # only falling back to a method call for photos not checked yet
+            photo_files = self.photo_files
+            orientation = self._orientation
+            for i in range(1, window):
+                next_photo = photo_files[(current_index + i) % num_photos]
+                portrait = orientation.get(next_photo)
+                if portrait is None:
+                    portrait = self.is_portrait_photo(next_photo)
+                if portrait:
+                    break
+            else:
+                # No portrait photo found in the lookahead window
+                return 0, None
+        
+        return i, next_photo
@@ -8,6 +8,15 @@ from .config_manager import Config
 from .photo_file_set import PhotoFileSet
 from .photo_display import PhotoDisplay
 
+
+def _mtime_ns(path):
+    """Get a file's modification time in nanoseconds, or None if it can't be read."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
 class PhotoFrame(QMainWindow):
     def __init__(self, config_path="config.yaml"):
         super().__init__()
@@ -25,6 +34,15 @@ class PhotoFrame(QMainWindow):
         self.view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.view.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.view.setFrameShape(QGraphicsView.Shape.NoFrame)
+        
+        # The background is static, and each transition frame only needs the
+        # photo items' area repainted; no item antialiases or leaks painter state
+        self.view.setCacheMode(QGraphicsView.CacheModeFlag.CacheBackground)
+        self.view.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.MinimalViewportUpdate)
+        self.view.setOptimizationFlags(
+            QGraphicsView.OptimizationFlag.DontSavePainterState
+            | QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing
+        )
         self.setCentralWidget(self.view)
 
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
@@ -50,23 +68,53 @@ class PhotoFrame(QMainWindow):
         self.timer.setSingleShot(True)
         self.timer.timeout.connect(self.next_photo)
         
+        # Polls for the full photo while an EXIF thumbnail preview is shown
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setInterval(50)
+        self._preview_timer.timeout.connect(self._replace_preview)
+        
+        # Coalesce bursts of resize events into a single redraw once they settle.
+        # The window size is kept up to date here rather than queried per photo.
+        self._screen_size = (self.width(), self.height())
+        self._shown_size = None
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(150)
+        self._resize_timer.timeout.connect(self._on_resize_settled)
+        
+        # Photos that failed to load, with their mtime at the time; they're
+        # skipped instead of being retried until the file changes
+        self._bad_paths = {}
+        
         # Start the slideshow
         self.show_photo()
     
     def show_photo(self, skip_transition=False):
-        # Get current photo path
+        # A new slide ends any thumbnail preview still waiting for its full photo
+        self._preview_timer.stop()
+        self.photo_display.release_preview()
+        
+        # Get current photo path, skipping photos that already failed to load
         current_photo = self.photo_file_set.get_current_photo_path()
+        for _ in range(len(self.photo_file_set)):
+            if not self._is_bad_path(current_photo):
+                break
+            self.photo_file_set.next_photo()
+            current_photo = self.photo_file_set.get_current_photo_path()
         if not current_photo:
             return
+        
+        # Get screen dimensions
+        screen_size = self._screen_size
+        self._shown_size = screen_size
+        
+        # Get configuration settings
+        apply_blur = self.config.get('blur_zoom_background', False)
+        show_metadata = self.config.get('show_metadata', False)
+        
+        show_pair = False
             
         try:
-            # Get screen dimensions
-            screen_size = (self.width(), self.height())
-            
-            # Get configuration settings
-            apply_blur = self.config.get('blur_zoom_background', False)
-            show_metadata = self.config.get('show_metadata', False)
-            
             # Check if we should display a pair of portrait photos
             show_pair, second_photo = self.photo_file_set.find_portrait_pair(current_photo)
             
@@ -79,7 +127,7 @@ class PhotoFrame(QMainWindow):
                     self._first_photo_shown = True
                 else:
                     # Prepare photo details and use transition
-                    photo_details = self.photo_display.photo_prep_manager.prepare_photo_pair(
+                    photo_details = self.photo_display.prepare_photo_pair(
                         current_photo, second_photo, screen_size, apply_blur, show_metadata)
                     self.photo_display.start_photo_transition(photo_details)
                 
@@ -92,38 +140,102 @@ class PhotoFrame(QMainWindow):
                     self.photo_display.show_single_photo(current_photo, screen_size, apply_blur, show_metadata)
                     self._first_photo_shown = True
                 else:
-                    # Prepare photo details and use transition
-                    photo_details = self.photo_display.photo_prep_manager.prepare_single_photo(
-                        current_photo, screen_size, apply_blur, show_metadata)
+                    # If the photo isn't decoded yet, fade in its EXIF thumbnail
+                    # and swap the full photo in once the background decode is done
+                    photo_details = None
+                    if not self.photo_display.is_single_photo_ready(current_photo, screen_size, apply_blur, show_metadata):
+                        photo_details = self.photo_display.prepare_single_preview(
+                            current_photo, screen_size, apply_blur, show_metadata)
+                    if photo_details is not None:
+                        self._preview_timer.start()
+                    else:
+                        # Prepare photo details and use transition
+                        photo_details = self.photo_display.prepare_single_photo(
+                            current_photo, screen_size, apply_blur, show_metadata)
                     self.photo_display.start_photo_transition(photo_details)
-            
-            # Set up timer for next photo
-            self.timer.stop()
-            self.timer.start(self.display_time)
-            
         except Exception as e:
             print(f"Error showing photo {current_photo}: {e}")
-            # Improved error recovery to prevent infinite recursion
-            # Move to the next photo
-            self.photo_file_set.next_photo()
-            
-            # Set a maximum number of consecutive errors to prevent infinite loops
-            if not hasattr(self, '_error_count'):
-                self._error_count = 0
+            # A failed pair doesn't tell which of the two photos is broken
+            self._skip_failed_photo(None if show_pair else current_photo)
+            return
+        
+        self._error_count = 0
+        
+        # Set up timer for next photo
+        self.timer.stop()
+        self.timer.start(self.display_time)
+        
+        # Decode the next photo(s) in the background while this one is shown.
+        # The current photo is already up, so a failure here is only reported;
+        # a broken next photo gets handled when it's shown.
+        try:
+            self._prefetch_next_photo(screen_size, apply_blur, show_metadata)
+        except Exception as e:
+            print(f"Error prefetching the next photo: {e}")
+    
+    def _skip_failed_photo(self, bad_path):
+        """Move on to the next photo after the current one failed to show.
+        
+        Args:
+            bad_path: Path of the photo to skip from now on, or None if it's
+                unknown which photo failed
+        """
+        if bad_path is not None:
+            self._bad_paths[bad_path] = _mtime_ns(bad_path)
+        # Improved error recovery to prevent infinite recursion
+        # Move to the next photo
+        self.photo_file_set.next_photo()
+        
+        # Set a maximum number of consecutive errors to prevent infinite loops
+        if not hasattr(self, '_error_count'):
+            self._error_count = 0
+        
+        self._error_count += 1
+        
+        # If we've had too many errors in a row, reset and stop trying
+        if self._error_count > 5:
+            print("Too many consecutive errors. Stopping slideshow.")
+            self._error_count = 0
+            # Reset timer to try again after a delay
+            self.timer.stop()
+            self.timer.start(self.display_time)
+            return
             
-            self._error_count += 1
+        # Try the next photo without transition
+        self.show_photo(skip_transition=True)
+    
+    def _is_bad_path(self, photo_path):
+        """Check whether a photo failed to load and hasn't changed since.
+        
+        Args:
+            photo_path: Path to the photo
             
-            # If we've had too many errors in a row, reset and stop trying
-            if self._error_count > 5:
-                print("Too many consecutive errors. Stopping slideshow.")
-                self._error_count = 0
-                # Reset timer to try again after a delay
-                self.timer.stop()
-                self.timer.start(self.display_time)
-                return
-                
-            # Try the next photo without transition
-            self.show_photo(skip_transition=True)
+        Returns:
+            True if the photo should be skipped
+        """
+        if photo_path not in self._bad_paths:
+            return False
+        if _mtime_ns(photo_path) == self._bad_paths[photo_path]:
+            return True
+        # The file was replaced since it failed, so give it another try
+        del self._bad_paths[photo_path]
+        return False
+    
+    def _prefetch_next_photo(self, screen_size, apply_blur, show_metadata):
+        """Start preparing the photo(s) the slideshow will show next.
+        
+        Args:
+            screen_size: (width, height) tuple
+            apply_blur: Whether to apply blur effect
+            show_metadata: Whether to show metadata overlay
+        """
+        next_photo, second_photo = self.photo_file_set.peek_next_photos()
+        if not next_photo:
+            return
+        if second_photo:
+            self.photo_display.prefetch_photo_pair(next_photo, second_photo, screen_size, apply_blur, show_metadata)
+        else:
+            self.photo_display.prefetch_single_photo(next_photo, screen_size, apply_blur, show_metadata)
     
     def next_photo(self, skip_transition=False):
         self.photo_file_set.next_photo()
@@ -145,6 +257,46 @@ class PhotoFrame(QMainWindow):
         # Get the next photo with transition skipped
         self.next_photo(skip_transition=True)
 
+    def _replace_preview(self):
+        """Replace a thumbnail preview with the full photo once it's ready."""
+        try:
+            done = self.photo_display.replace_preview()
+        except Exception:
+            # Don't leave the thumbnail up in place of a photo that can't be
+            # loaded; previews are only used for single photos, so it's the
+            # current one
+            self._preview_timer.stop()
+            self._skip_failed_photo(self.photo_file_set.get_current_photo_path())
+            return
+        if done:
+            self._preview_timer.stop()
+    
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._screen_size = (event.size().width(), event.size().height())
+        # Restart the countdown so only the final size of a resize gets redrawn
+        if hasattr(self, '_resize_timer'):
+            self._resize_timer.start()
+    
+    def _on_resize_settled(self):
+        """Redraw the current photo(s) for the new window size."""
+        screen_size = self._screen_size
+        if screen_size == self._shown_size:
+            return
+        
+        # The photo(s) redisplay will show, to skip if they can't be loaded anymore
+        photo_display = self.photo_display
+        photo_details = (photo_display.in_transition and photo_display.next_photo_details
+                         or photo_display.current_photo_details)
+        try:
+            photo_display.redisplay(screen_size)
+        except Exception as e:
+            print(f"Error redrawing photo: {e}")
+            # A failed pair doesn't tell which of the two photos is broken
+            self._skip_failed_photo(photo_details.path if photo_details.mode == 'single' else None)
+            return
+        self._shown_size = screen_size
+
     def keyPressEvent(self, event):
         # Exit on Escape key
         if event.key() == Qt.Key.Key_Escape:
@@ -1,14 +1,73 @@
 """
 Handles photo preparation for display.
 """
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap, QImage
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
+
+from PIL import Image
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QPixmap, QPixmapCache, QImage, QImageIOHandler, QImageReader
+
+from .photo_processing import (
+    RESIZE_REDUCING_GAP, LazyExif, get_scaled_size, load_exif_thumbnail, load_photo, photo_file_key,
+    read_exif
+)
+
+# Photos Qt can decode and scale natively (libjpeg scales during the IDCT)
+_QT_DECODE_EXTENSIONS = ('.jpg', '.jpeg')
+
+
+class PhotoDetails(NamedTuple):
+    """A photo, or pair of portrait photos, prepared for display.
+    
+    Single photos use the pixmap/exif/path/image_x/image_y fields; pairs use
+    the numbered fields for the left (1) and right (2) photos.
+    """
+    mode: str  # "single" or "pair"
+    screen_size: Tuple[int, int]
+    apply_blur: bool
+    show_metadata: bool
+    pixmap: Optional[QPixmap] = None
+    exif: Optional[LazyExif] = None
+    path: Optional[str] = None
+    image_x: int = 0
+    image_y: int = 0
+    pixmap1: Optional[QPixmap] = None
+    exif1: Optional[LazyExif] = None
+    path1: Optional[str] = None
+    image1_x: int = 0
+    image1_y: int = 0
+    pixmap2: Optional[QPixmap] = None
+    exif2: Optional[LazyExif] = None
+    path2: Optional[str] = None
+    image2_x: int = 0
+    image2_y: int = 0
+    is_preview: bool = False  # pixmap is the EXIF thumbnail standing in for the photo
+
+class _ScaledImage(NamedTuple):
+    """A scaled QImage together with the buffer its pixels live in.
+    
+    The QImage wraps the buffer without copying it, so the buffer has to be
+    kept alive until the image is converted to a pixmap. Images Qt decoded
+    itself own their pixels and have no buffer.
+    """
+    image: QImage
+    buffer: Optional[bytes] = None
 
-from .photo_processing import load_photo
 
 class PhotoPreparationManager:
     """Manages photo preparation for display."""
     
+    # Maximum number of photos decoded ahead of time; one slide is at most a pair
+    PREFETCH_LIMIT = 2
+    
+    # QPixmapCache budget for scaled photos, in KiB, and how many of their EXIF
+    # records to keep alongside them
+    PIXMAP_CACHE_LIMIT_KB = 256 * 1024
+    EXIF_CACHE_SIZE = 64
+    
     def __init__(self, config):
         """Initialize the photo preparation manager.
         
@@ -16,6 +75,283 @@ class PhotoPreparationManager:
             config: Configuration object
         """
         self.config = config
+        
+        # Photos are decoded ahead of time on worker threads so the UI thread
+        # doesn't stall on JPEG decoding when the slide changes; one worker per
+        # photo of a pair lets both decode at once
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=self.PREFETCH_LIMIT, thread_name_prefix="PhotoPrefetch")
+        self._prefetched = OrderedDict()  # (path, load size, max size, apply_blur) -> Future
+        
+        # Prefetch key of the photo whose EXIF thumbnail is standing in for it;
+        # prefetches for upcoming slides must not evict it
+        self._preview_key = None
+        
+        # Scaled pixmaps are kept in QPixmapCache, which evicts by memory use;
+        # the EXIF of each cached photo is kept here under the same key
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), self.PIXMAP_CACHE_LIMIT_KB))
+        self._exif_cache = OrderedDict()
+    
+    def clear_cache(self):
+        """Drop all cached pixmaps and pending prefetches."""
+        for future in self._prefetched.values():
+            future.cancel()
+        self._prefetched.clear()
+        self._preview_key = None
+        for key in self._exif_cache:
+            QPixmapCache.remove(key)
+        self._exif_cache.clear()
+    
+    def prefetch_single_photo(self, photo_path, screen_size, apply_blur):
+        """Start decoding and scaling a single photo in the background.
+        
+        Args:
+            photo_path: Path to the photo
+            screen_size: (width, height) tuple
+            apply_blur: Whether to apply blur effect
+        """
+        self._prefetch(photo_path, screen_size, screen_size, apply_blur)
+    
+    def prefetch_photo_pair(self, photo1_path, photo2_path, screen_size, apply_blur):
+        """Start decoding and scaling a pair of photos in the background.
+        
+        Args:
+            photo1_path: Path to the first photo
+            photo2_path: Path to the second photo
+            screen_size: (width, height) tuple
+            apply_blur: Whether to apply blur effect
+        """
+        load_size, max_size = self._pair_sizes(screen_size)
+        self._prefetch(photo1_path, load_size, max_size, apply_blur)
+        self._prefetch(photo2_path, load_size, max_size, apply_blur)
+    
+    def _prefetch(self, photo_path, load_size, max_size, apply_blur):
+        """Submit a photo to the prefetch worker unless it's already queued.
+        
+        Args:
+            photo_path: Path to the photo
+            load_size: (width, height) the photo is loaded for
+            max_size: (width, height) the image is scaled to fit
+            apply_blur: Whether to apply blur effect
+        """
+        key = (photo_path, tuple(load_size), tuple(max_size), apply_blur)
+        if key in self._prefetched:
+            self._prefetched.move_to_end(key)
+            return
+        if self._find_cached(photo_path, load_size, max_size, apply_blur):
+            return
+        self._prefetched[key] = self._prefetch_executor.submit(
+            self._load_scaled_image, photo_path, load_size, max_size, apply_blur)
+        
+        # Drop the oldest prefetches, apart from the previewed photo's, which
+        # doesn't count towards the limit; a future that hasn't started yet is cancelled
+        preview_key = self._preview_key
+        while len(self._prefetched) > self.PREFETCH_LIMIT + (preview_key in self._prefetched):
+            oldest = next(key for key in self._prefetched if key != preview_key)
+            self._prefetched.pop(oldest).cancel()
+    
+    @staticmethod
+    def _pixmap_cache_key(photo_path, load_size, max_size, apply_blur):
+        """Build the QPixmapCache key of a scaled photo.
+        
+        Photos are keyed by path, mtime and size, so a file edited in place
+        isn't served from the pixmap prepared for its old contents.
+        
+        Args:
+            photo_path: Path to the photo
+            load_size: (width, height) the photo is loaded for
+            max_size: (width, height) the image is scaled to fit
+            apply_blur: Whether to apply blur effect
+        
+        Returns:
+            Cache key string
+        """
+        return (f"veloframe:{photo_file_key(photo_path)}:{load_size[0]}x{load_size[1]}:"
+                f"{int(max_size[0])}x{int(max_size[1])}:{int(bool(apply_blur))}")
+    
+    def _find_cached(self, photo_path, load_size, max_size, apply_blur):
+        """Look up a scaled photo in the pixmap cache.
+        
+        Args:
+            photo_path: Path to the photo
+            load_size: (width, height) the photo is loaded for
+            max_size: (width, height) the image is scaled to fit
+            apply_blur: Whether to apply blur effect
+        
+        Returns:
+            Tuple of (QPixmap, EXIF data), or None if it isn't cached
+        """
+        key = self._pixmap_cache_key(photo_path, load_size, max_size, apply_blur)
+        exif = self._exif_cache.get(key)
+        if exif is None:
+            return None
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            # Evicted by QPixmapCache
+            del self._exif_cache[key]
+            return None
+        self._exif_cache.move_to_end(key)
+        return pixmap, exif
+    
+    def _get_pixmap(self, photo_path, load_size, max_size, apply_blur):
+        """Get a photo as a pixmap scaled to fit, from the cache when possible.
+        
+        Args:
+            photo_path: Path to the photo
+            load_size: (width, height) the photo is loaded for
+            max_size: (width, height) the image is scaled to fit
+            apply_blur: Whether to apply blur effect
+        
+        Returns:
+            Tuple of (QPixmap, EXIF data)
+        """
+        cached = self._find_cached(photo_path, load_size, max_size, apply_blur)
+        if cached is not None:
+            return cached
+        
+        scaled, exif = self._get_scaled_image(photo_path, load_size, max_size, apply_blur)
+        
+        # Only the pixmap conversion has to happen on the GUI thread
+        pixmap = QPixmap.fromImage(scaled.image)
+        
+        key = self._pixmap_cache_key(photo_path, load_size, max_size, apply_blur)
+        if QPixmapCache.insert(key, pixmap):
+            self._exif_cache[key] = exif
+            self._exif_cache.move_to_end(key)
+            while len(self._exif_cache) > self.EXIF_CACHE_SIZE:
+                QPixmapCache.remove(self._exif_cache.popitem(last=False)[0])
+        return pixmap, exif
+    
+    def _get_scaled_image(self, photo_path, load_size, max_size, apply_blur):
+        """Get a photo's scaled image, using the prefetched result when there is one.
+        
+        Args:
+            photo_path: Path to the photo
+            load_size: (width, height) the photo is loaded for
+            max_size: (width, height) the image is scaled to fit
+            apply_blur: Whether to apply blur effect
+        
+        Returns:
+            Tuple of (_ScaledImage, EXIF data)
+        """
+        key = (photo_path, tuple(load_size), tuple(max_size), apply_blur)
+        if key == self._preview_key:
+            self._preview_key = None
+        future = self._prefetched.pop(key, None)
+        if future is not None and not future.cancelled():
+            try:
+                return future.result()
+            except Exception:
+                # Load again below so the error is raised on the caller's thread
+                pass
+        return self._load_scaled_image(photo_path, load_size, max_size, apply_blur)
+    
+    def _load_scaled_image(self, photo_path, load_size, max_size, apply_blur):
+        """Load a photo and scale it to fit, without touching any GUI-thread-only types.
+        
+        Safe to run on the prefetch worker thread: only PIL and QImage are used.
+        
+        Args:
+            photo_path: Path to the photo
+            load_size: (width, height) the photo is loaded for
+            max_size: (width, height) the image is scaled to fit
+            apply_blur: Whether to apply blur effect
+        
+        Returns:
+            Tuple of (_ScaledImage, EXIF data)
+        """
+        # Without a blurred background, let Qt decode JPEGs straight to the fitted size
+        if not apply_blur and photo_path.lower().endswith(_QT_DECODE_EXTENSIONS):
+            qimg = self._read_scaled_image(photo_path, max_size[0], max_size[1])
+            if qimg is not None:
+                return _ScaledImage(qimg), read_exif(photo_path)
+        
+        pil_img, exif = load_photo(photo_path, load_size, apply_blur)
+        return self._to_scaled_image(pil_img, max_size[0], max_size[1]), exif
+    
+    @staticmethod
+    def _read_scaled_image(photo_path, max_width, max_height):
+        """Decode a photo with Qt, scaled to fit the given size during decoding.
+        
+        Args:
+            photo_path: Path to the photo
+            max_width: Maximum width of the image
+            max_height: Maximum height of the image
+        
+        Returns:
+            Upright QImage scaled to fit while maintaining aspect ratio, or None
+            if Qt can't read the photo
+        """
+        reader = QImageReader(photo_path)
+        reader.setAutoTransform(True)
+        size = reader.size()
+        if not size.isValid():
+            return None
+        width, height = size.width(), size.height()
+        rotated = bool(reader.transformation() & QImageIOHandler.Transformation.TransformationRotate90)
+        if rotated:
+            width, height = height, width
+        
+        # The scaled size applies before the EXIF rotation
+        scaled_width, scaled_height = get_scaled_size(width, height, max_width, max_height)
+        if rotated:
+            scaled_width, scaled_height = scaled_height, scaled_width
+        reader.setScaledSize(QSize(scaled_width, scaled_height))
+        
+        qimg = reader.read()
+        return None if qimg.isNull() else qimg
+    
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _pair_sizes(screen_size):
+        """Get the sizes each photo of a pair is loaded for and scaled to fit.
+        
+        Args:
+            screen_size: (width, height) tuple
+        
+        Returns:
+            Tuple of (load size, max size) as (width, height) tuples
+        """
+        # Each image gets approximately half the screen width with a small gap between
+        max_width = screen_size[0] // 2 - 10  # 10px gap (5px on each side)
+        max_size = (max_width, screen_size[1])
+        
+        # Load at the final size so a blurred background comes out of PIL already
+        # fitted and doesn't need a second resize
+        return max_size, max_size
+    
+    @staticmethod
+    def _to_scaled_image(pil_img, max_width, max_height):
+        """Convert a PIL image into a QImage scaled to fit the given size.
+        
+        Scaling happens in PIL so only the final, screen-sized pixels are
+        copied into the QImage.
+        
+        Args:
+            pil_img: RGB or RGBA PIL image
+            max_width: Maximum width of the image
+            max_height: Maximum height of the image
+        
+        Returns:
+            _ScaledImage holding the QImage scaled to fit while maintaining
+            aspect ratio, and the pixel buffer it wraps
+        """
+        scaled_size = get_scaled_size(pil_img.width, pil_img.height, max_width, max_height)
+        if scaled_size != pil_img.size:
+            pil_img = pil_img.resize(scaled_size, Image.Resampling.LANCZOS, reducing_gap=RESIZE_REDUCING_GAP)
+        
+        # Wrap the pixel bytes without copying them again; the buffer travels
+        # with the image until QPixmap.fromImage has copied the pixels. Opaque
+        # photos stay 3 bytes per pixel; transparent ones are premultiplied here,
+        # off the GUI thread, since that's what Qt composites with
+        if pil_img.mode == 'RGBA':
+            img_byte_arr = pil_img.convert('RGBa').tobytes('raw', 'RGBa')
+            qimg = QImage(img_byte_arr, pil_img.width, pil_img.height, pil_img.width * 4,
+                          QImage.Format.Format_RGBA8888_Premultiplied)
+        else:
+            img_byte_arr = pil_img.tobytes('raw', 'RGB')
+            qimg = QImage(img_byte_arr, pil_img.width, pil_img.height, pil_img.width * 3,
+                          QImage.Format.Format_RGB888)
+        return _ScaledImage(qimg, img_byte_arr)
     
     def prepare_single_photo(self, photo_path, screen_size, apply_blur, show_metadata):
         """Prepare a single photo for display.
@@ -27,43 +363,82 @@ class PhotoPreparationManager:
             show_metadata: Whether to show metadata overlay
         
         Returns:
-            Dictionary with photo details
+            PhotoDetails for the photo
         """
-        # Load the photo with blur effect if enabled
-        pil_img, exif = load_photo(photo_path, screen_size, apply_blur)
+        # Load the photo with blur effect if enabled, scaled to fit the screen while maintaining aspect ratio
+        pixmap, exif = self._get_pixmap(photo_path, screen_size, screen_size, apply_blur)
         
-        # Convert PIL image to Qt pixmap
-        img_byte_arr = pil_img.tobytes('raw', 'RGBA')
-        qimg = QImage(img_byte_arr, pil_img.width, pil_img.height, QImage.Format.Format_RGBA8888)
-        pixmap = QPixmap.fromImage(qimg)
+        # Calculate position
+        image_x = (screen_size[0] - pixmap.width()) // 2
+        image_y = (screen_size[1] - pixmap.height()) // 2
         
-        # Scale the pixmap to fit the screen while maintaining aspect ratio
-        pixmap = pixmap.scaled(
-            screen_size[0], screen_size[1],
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
+        # Prepare the pixmap for display
+        return PhotoDetails(
+            mode='single',
+            screen_size=screen_size,
+            apply_blur=apply_blur,
+            show_metadata=show_metadata,
+            pixmap=pixmap,
+            exif=exif,
+            path=photo_path,
+            image_x=image_x,
+            image_y=image_y
         )
+    
+    def is_single_photo_ready(self, photo_path, screen_size, apply_blur):
+        """Check whether a single photo can be prepared without decoding it now.
         
-        # Prepare the pixmap for display
-        photo_details = {
-            'mode': 'single',
-            'pixmap': pixmap,
-            'exif': exif,
-            'path': photo_path,
-            'screen_size': screen_size,
-            'apply_blur': apply_blur,
-            'show_metadata': show_metadata
-        }
+        Args:
+            photo_path: Path to the photo
+            screen_size: (width, height) tuple
+            apply_blur: Whether to apply blur effect
         
-        # Calculate position
-        image_x = (screen_size[0] - pixmap.width()) / 2
-        image_y = (screen_size[1] - pixmap.height()) / 2
+        Returns:
+            True if the photo is cached or its prefetch has finished
+        """
+        if self._find_cached(photo_path, screen_size, screen_size, apply_blur) is not None:
+            return True
+        future = self._prefetched.get((photo_path, tuple(screen_size), tuple(screen_size), apply_blur))
+        return future is not None and future.done()
+    
+    def prepare_single_preview(self, photo_path, screen_size, apply_blur, show_metadata):
+        """Prepare a stand-in for a single photo from its embedded EXIF thumbnail.
         
-        # Add position to details
-        photo_details['image_x'] = image_x
-        photo_details['image_y'] = image_y
+        The full photo is queued for background decoding so it can replace the
+        preview once ready.
         
-        return photo_details
+        Args:
+            photo_path: Path to the photo
+            screen_size: (width, height) tuple
+            apply_blur: Whether to apply blur effect
+            show_metadata: Whether to show metadata overlay
+        
+        Returns:
+            PhotoDetails with is_preview set, or None if the photo has no thumbnail
+        """
+        thumbnail = load_exif_thumbnail(photo_path)
+        if thumbnail is None:
+            return None
+        self.prefetch_single_photo(photo_path, screen_size, apply_blur)
+        self._preview_key = (photo_path, tuple(screen_size), tuple(screen_size), apply_blur)
+        
+        pixmap = QPixmap.fromImage(self._to_scaled_image(thumbnail, screen_size[0], screen_size[1]).image)
+        return PhotoDetails(
+            mode='single',
+            screen_size=screen_size,
+            apply_blur=apply_blur,
+            show_metadata=show_metadata,
+            pixmap=pixmap,
+            exif=read_exif(photo_path),
+            path=photo_path,
+            image_x=(screen_size[0] - pixmap.width()) // 2,
+            image_y=(screen_size[1] - pixmap.height()) // 2,
+            is_preview=True
+        )
+    
+    def release_preview(self):
+        """Let the previewed photo's prefetch be evicted again, e.g. once its slide is over."""
+        self._preview_key = None
     
     def prepare_photo_pair(self, photo1_path, photo2_path, screen_size, apply_blur, show_metadata):
         """Prepare a pair of photos for display.
@@ -76,72 +451,45 @@ class PhotoPreparationManager:
             show_metadata: Whether to show metadata overlay
         
         Returns:
-            Dictionary with photo pair details
+            PhotoDetails for the photo pair
         """
-        # Calculate half screen size for each photo (minus gap)
-        half_screen_width = (screen_size[0] / 2) - 5  # 5px half of the 10px gap
-        half_screen_size = (int(half_screen_width), screen_size[1])
-        
-        # Load both photos with half screen size each to apply blur to each individually
-        pil_img1, exif1 = load_photo(photo1_path, half_screen_size, apply_blur)
-        pil_img2, exif2 = load_photo(photo2_path, half_screen_size, apply_blur)
+        load_size, max_size = self._pair_sizes(screen_size)
         
-        # Convert PIL images to Qt pixmaps
-        img_byte_arr1 = pil_img1.tobytes('raw', 'RGBA')
-        qimg1 = QImage(img_byte_arr1, pil_img1.width, pil_img1.height, QImage.Format.Format_RGBA8888)
-        pixmap1 = QPixmap.fromImage(qimg1)
+        # Start whichever photos aren't ready yet on the prefetch workers, so a
+        # pair that missed the cache decodes both photos in parallel
+        self._prefetch(photo1_path, load_size, max_size, apply_blur)
+        self._prefetch(photo2_path, load_size, max_size, apply_blur)
         
-        img_byte_arr2 = pil_img2.tobytes('raw', 'RGBA')
-        qimg2 = QImage(img_byte_arr2, pil_img2.width, pil_img2.height, QImage.Format.Format_RGBA8888)
-        pixmap2 = QPixmap.fromImage(qimg2)
-        
-        # Calculate the maximum height to use for both images
-        # Each image gets approximately half the screen width with a small gap between
-        max_width = (screen_size[0] / 2) - 10  # 10px gap (5px on each side)
-        
-        # Scale both pixmaps to the same height
-        pixmap1 = pixmap1.scaled(
-            max_width,
-            screen_size[1],
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
-        
-        pixmap2 = pixmap2.scaled(
-            max_width,
-            screen_size[1],
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
-        
-        # Prepare the pair details for display
-        photo_details = {
-            'mode': 'pair',
-            'pixmap1': pixmap1,
-            'pixmap2': pixmap2,
-            'exif1': exif1,
-            'exif2': exif2,
-            'path1': photo1_path,
-            'path2': photo2_path,
-            'screen_size': screen_size,
-            'apply_blur': apply_blur,
-            'show_metadata': show_metadata
-        }
+        # Load both photos with half screen size each to apply blur to each individually,
+        # scaling both to the same height
+        pixmap1, exif1 = self._get_pixmap(photo1_path, load_size, max_size, apply_blur)
+        pixmap2, exif2 = self._get_pixmap(photo2_path, load_size, max_size, apply_blur)
         
         # Calculate positions for centered images
-        total_width = pixmap1.width() + 10 + pixmap2.width()  # 10px gap
-        start_x = (screen_size[0] - total_width) / 2
+        width1 = pixmap1.width()
+        total_width = width1 + 10 + pixmap2.width()  # 10px gap
+        start_x = (screen_size[0] - total_width) // 2
         
         image1_x = start_x
-        image1_y = (screen_size[1] - pixmap1.height()) / 2
-        
-        image2_x = start_x + pixmap1.width() + 10  # 10px gap
-        image2_y = (screen_size[1] - pixmap2.height()) / 2
+        image1_y = (screen_size[1] - pixmap1.height()) // 2
         
-        # Add positions to details
-        photo_details['image1_x'] = image1_x
-        photo_details['image1_y'] = image1_y
-        photo_details['image2_x'] = image2_x
-        photo_details['image2_y'] = image2_y
+        image2_x = start_x + width1 + 10  # 10px gap
+        image2_y = (screen_size[1] - pixmap2.height()) // 2
         
-        return photo_details
+        # Prepare the pair details for display
+        return PhotoDetails(
+            mode='pair',
+            screen_size=screen_size,
+            apply_blur=apply_blur,
+            show_metadata=show_metadata,
+            pixmap1=pixmap1,
+            exif1=exif1,
+            path1=photo1_path,
+            image1_x=image1_x,
+            image1_y=image1_y,
+            pixmap2=pixmap2,
+            exif2=exif2,
+            path2=photo2_path,
+            image2_x=image2_x,
+            image2_y=image2_y
+        )
@@ -1,10 +1,132 @@
+import io
+import logging
+import math
 import os
+from functools import lru_cache
 from typing import Dict, Tuple, Optional, List
 import arrow
 
 from PIL import Image, ImageOps, ImageFilter
 from PIL.ExifTags import TAGS as ExifTags
 
+logger = logging.getLogger(__name__)
+
+
+# EXIF sub-IFD holding capture details such as DateTimeOriginal
+EXIF_IFD_TAG = 0x8769
+
+
+class LazyExif:
+    """Read-only EXIF mapping from tag names to values, decoded on first access.
+    
+    Building the full tag-name dictionary walks the EXIF sub-IFD, which is wasted
+    work when the metadata overlay is disabled, so it is deferred until a value
+    is actually looked up.
+    """
+    __slots__ = ('_exif', '_data')
+    
+    def __init__(self, exif: Image.Exif):
+        """Initialize the mapping.
+        
+        Args:
+            exif: PIL Exif object of the opened image
+        """
+        self._exif = exif
+        self._data = None
+    
+    def _load(self) -> Dict:
+        """Decode the EXIF tags into a name -> value dictionary, once."""
+        if self._data is None:
+            data = {}
+            try:
+                tags = dict(self._exif)
+                tags.update(self._exif.get_ifd(EXIF_IFD_TAG))
+                data = {ExifTags[k]: v for k, v in tags.items() if k in ExifTags}
+            except Exception as e:
+                logger.warning("Error processing EXIF data: %s", e)
+            self._data = data
+            self._exif = None
+        return self._data
+    
+    def get(self, key, default=None):
+        return self._load().get(key, default)
+    
+    def __getitem__(self, key):
+        return self._load()[key]
+    
+    def __contains__(self, key):
+        return key in self._load()
+    
+    def __iter__(self):
+        return iter(self._load())
+    
+    def __len__(self):
+        return len(self._load())
+
+
+def read_exif(photo_path: str) -> LazyExif:
+    """Read a photo's EXIF data without decoding its pixels.
+    
+    Results are memoized per path, mtime and size, so a photo shown again
+    reuses its already decoded tags.
+    
+    Args:
+        photo_path: Path to the photo file
+        
+    Returns:
+        LazyExif mapping, empty if the EXIF data can't be read
+    """
+    try:
+        stat_result = os.stat(photo_path)
+    except OSError as e:
+        logger.warning("Error processing EXIF data: %s", e)
+        return LazyExif(Image.Exif())
+    return _read_exif(photo_path, stat_result.st_mtime_ns, stat_result.st_size)
+
+
+@lru_cache(maxsize=512)
+def _read_exif(photo_path: str, mtime_ns: int, size: int) -> LazyExif:
+    """Read a photo's EXIF data, memoized per path, mtime and size.
+    
+    Args:
+        photo_path: Path to the photo file
+        mtime_ns: File modification time in nanoseconds (cache key only)
+        size: File size in bytes (cache key only)
+        
+    Returns:
+        LazyExif mapping, empty if the EXIF data can't be read
+    """
+    try:
+        with Image.open(photo_path) as img:
+            return LazyExif(_header_exif(img))
+    except Exception as e:
+        logger.warning("Error processing EXIF data: %s", e)
+        return LazyExif(Image.Exif())
+
+
+def _header_exif(img: Image.Image) -> Image.Exif:
+    """Get an opened image's EXIF data without decoding its pixels.
+    
+    Args:
+        img: Opened PIL image
+        
+    Returns:
+        PIL Exif object
+    """
+    if img.format == 'PNG':
+        # PNG's getexif() decodes the whole image looking for a trailing
+        # eXIf chunk, so only use EXIF found before the image data
+        exif = Image.Exif()
+        if 'exif' in img.info:
+            exif.load(img.info['exif'])
+        return exif
+    return img.getexif()
+
+
+def clear_exif_cache() -> None:
+    """Clear the memoized EXIF data, e.g. after rescanning photos."""
+    _read_exif.cache_clear()
+
 
 def load_photo(photo_path: str, screen_size: Optional[Tuple[int, int]] = None, apply_blur_background: bool = False) -> Tuple[Image.Image, Dict]:
     """Load a photo and process it for display.
@@ -15,27 +137,30 @@ def load_photo(photo_path: str, screen_size: Optional[Tuple[int, int]] = None, a
         apply_blur_background: Whether to apply a blurred background effect for photos that don't fill the screen
         
     Returns:
-        Tuple of (processed PIL image, EXIF data dictionary)
+        Tuple of (processed RGB or RGBA PIL image, EXIF data as a read-only LazyExif mapping)
     """
     # Load image with PIL for processing
     Image.MAX_IMAGE_PIXELS = None # Allow loading large images, unsafe for untrusted images
     pil_img = Image.open(photo_path)
     
-    # Process EXIF data
-    exif = {}
+    # Process EXIF data; tags are only decoded if the metadata overlay asks for them
+    exif = read_exif(photo_path)
     try:
-        if hasattr(pil_img, '_getexif') and pil_img._getexif():
-            exif = {ExifTags[k]: v for k, v in pil_img._getexif().items() 
-                   if k in ExifTags}
+        # Let libjpeg downscale by 1/2, 1/4 or 1/8 while decoding
+        if screen_size and pil_img.format == 'JPEG':
+            _draft_for_screen(pil_img, screen_size)
         
         # Rotate image based on EXIF orientation
         pil_img = ImageOps.exif_transpose(pil_img)
-    except Exception as e:
-        print(f"Error processing EXIF data: {e}")
+    except (AttributeError, KeyError, TypeError, ValueError) as e:
+        # Decoding errors aren't caught here; they're raised to the caller
+        logger.warning("Error processing EXIF data: %s", e)
     
-    # Ensure image is in RGBA mode for consistent handling
-    if pil_img.mode != 'RGBA':
-        pil_img = pil_img.convert('RGBA')
+    # Ensure image is in RGB mode for consistent handling, keeping an alpha
+    # channel only for images that can actually be transparent
+    display_mode = 'RGBA' if has_alpha(pil_img) else 'RGB'
+    if pil_img.mode != display_mode:
+        pil_img = pil_img.convert(display_mode)
     
     # Apply blurred background if requested and screen size is provided
     if apply_blur_background and screen_size:
@@ -44,6 +169,49 @@ def load_photo(photo_path: str, screen_size: Optional[Tuple[int, int]] = None, a
     return pil_img, exif
 
 
+def has_alpha(pil_img: Image.Image) -> bool:
+    """Check whether an image can contain transparent pixels.
+    
+    Args:
+        pil_img: PIL image
+        
+    Returns:
+        True if the image has an alpha channel or a transparent palette/color entry
+    """
+    return pil_img.mode in ('RGBA', 'LA', 'PA', 'RGBa', 'La') or 'transparency' in pil_img.info
+
+
+def _draft_for_screen(pil_img: Image.Image, screen_size: Tuple[int, int]) -> None:
+    """Configure a JPEG to decode at the smallest DCT scale that still covers the screen.
+    
+    The decoded image is never smaller than what's needed to cover the screen, so
+    both fitting the photo and filling a blurred background keep full quality.
+    
+    Args:
+        pil_img: Opened, not yet loaded, JPEG image
+        screen_size: Tuple of (width, height) of the screen
+    """
+    img_width, img_height = pil_img.size
+    screen_width, screen_height = screen_size
+    if pil_img.getexif().get(EXIF_ORIENTATION_TAG, 1) in _TRANSPOSED_ORIENTATIONS:
+        # The screen size applies to the image after it's rotated upright
+        screen_width, screen_height = screen_height, screen_width
+    
+    cover_scale = max(screen_width / img_width, screen_height / img_height)
+    if cover_scale < 1:
+        pil_img.draft(pil_img.mode, (math.ceil(img_width * cover_scale), math.ceil(img_height * cover_scale)))
+
+
+# Gaussian blur radius of the background at screen resolution, and the width
+# the background is actually blurred at
+BLUR_RADIUS = 75
+BLUR_WORK_WIDTH = 256
+
+# Downscales by more than this factor start with a fast integer box reduction
+# before the final resampling filter; 3.0 is indistinguishable from a single pass
+RESIZE_REDUCING_GAP = 3.0
+
+
 def create_blurred_background(image: Image.Image, screen_size: Tuple[int, int]) -> Image.Image:
     """Create a blurred background for photos that don't fill the screen.
     
@@ -63,28 +231,36 @@ def create_blurred_background(image: Image.Image, screen_size: Tuple[int, int])
     
     # Check if the image would have black bars (doesn't fill screen completely)
     if scaled_size[0] < screen_width or scaled_size[1] < screen_height:
-        # Create a copy of the image for the background
-        background = image.copy()
-        
-        # Step 1: Resize the background image to completely fill the screen
+        # Step 1: Work out the background size that completely fills the screen
         # Calculate the scale factor needed to ensure both dimensions are at least as large as the screen
         bg_scale_factor = max(screen_width / img_width, screen_height / img_height)
         bg_width = int(img_width * bg_scale_factor)
         bg_height = int(img_height * bg_scale_factor)
-        background = background.resize((bg_width, bg_height), Image.Resampling.LANCZOS)
         
-        # Step 2: Apply gaussian blur to the background
-        background = background.filter(ImageFilter.GaussianBlur(radius=75))
+        # Step 2: Apply gaussian blur to a small copy of the background. A blur this
+        # strong leaves no detail a low-resolution copy can't hold, so the radius is
+        # scaled down with the image instead of blurring at screen resolution.
+        work_scale = min(1.0, BLUR_WORK_WIDTH / bg_width)
+        work_width = max(1, round(bg_width * work_scale))
+        work_height = max(1, round(bg_height * work_scale))
+        background = image.resize((work_width, work_height), Image.Resampling.BILINEAR, reducing_gap=RESIZE_REDUCING_GAP)
+        background = background.filter(ImageFilter.GaussianBlur(radius=BLUR_RADIUS * work_scale))
         
-        # Step 3: Center crop the background to screen size
+        # Step 3: Center crop the background to screen size, scaling the blurred copy back up
         left = (bg_width - screen_width) // 2
         top = (bg_height - screen_height) // 2
         right = left + screen_width
         bottom = top + screen_height
-        background = background.crop((left, top, right, bottom))
+        x_scale = work_width / bg_width
+        y_scale = work_height / bg_height
+        background = background.resize(
+            (screen_width, screen_height), Image.Resampling.BILINEAR,
+            box=(left * x_scale, top * y_scale, right * x_scale, bottom * y_scale)
+        )
         
-        # Step 4: Resize the original image to fit the screen while maintaining aspect ratio
-        foreground = image.resize(scaled_size, Image.Resampling.LANCZOS)
+        # Step 4: Resize the original image to fit the screen while maintaining aspect ratio;
+        # large reductions are box-reduced first so LANCZOS only covers the last steps
+        foreground = image.resize(scaled_size, Image.Resampling.LANCZOS, reducing_gap=RESIZE_REDUCING_GAP)
         
         # Step 5: Create a new image with the background
         result = background
@@ -92,7 +268,7 @@ def create_blurred_background(image: Image.Image, screen_size: Tuple[int, int])
         # Step 6: Paste the foreground image centered on the background
         paste_x = (screen_width - scaled_size[0]) // 2
         paste_y = (screen_height - scaled_size[1]) // 2
-        result.paste(foreground, (paste_x, paste_y), foreground)
+        result.paste(foreground, (paste_x, paste_y), foreground if foreground.mode == 'RGBA' else None)
         
         return result
     
@@ -100,9 +276,12 @@ def create_blurred_background(image: Image.Image, screen_size: Tuple[int, int])
     return image
 
 
+@lru_cache(maxsize=64)
 def get_scaled_size(img_width: int, img_height: int, target_width: int, target_height: int) -> Tuple[int, int]:
     """Calculate the size of an image when scaled to fit within target dimensions while maintaining aspect ratio.
     
+    Photo and screen sizes repeat across a slideshow, so results are memoized.
+    
     Args:
         img_width: Original image width
         img_height: Original image height
@@ -136,26 +315,131 @@ def get_capture_date_str(exif: Dict, file_path: str) -> str:
     Returns:
         Formatted date string
     """
-    capture_date = None
-    if 'DateTimeOriginal' in exif:
-        try:
-            # Convert EXIF date format to Arrow
-            date_str = exif['DateTimeOriginal']
-            capture_date = arrow.get(date_str, 'YYYY:MM:DD HH:mm:ss')
-        except (ValueError, TypeError):
-            pass
+    date_str = exif.get('DateTimeOriginal')
+    if isinstance(date_str, str):
+        capture_date_str = _format_exif_date(date_str)
+        if capture_date_str is not None:
+            return capture_date_str
+    
+    # Only photos without a usable EXIF date touch the file system
+    return _format_mtime_date(os.path.getmtime(file_path))
+
+
+@lru_cache(maxsize=256)
+def _format_exif_date(date_str: str) -> Optional[str]:
+    """Format an EXIF DateTimeOriginal value, memoized per value.
     
-    if not capture_date:
-        # Use Arrow to get file modification time
-        capture_date = arrow.get(os.path.getmtime(file_path))
+    Args:
+        date_str: EXIF DateTimeOriginal value
+        
+    Returns:
+        Formatted date string, or None if the value isn't a valid date
+    """
+    try:
+        # Convert EXIF date format to Arrow
+        capture_date = arrow.get(date_str, 'YYYY:MM:DD HH:mm:ss')
+    except (ValueError, TypeError):
+        return None
     
     # Format the date using Arrow's formatting
     return capture_date.format("DD MMMM YYYY")
 
 
+@lru_cache(maxsize=256)
+def _format_mtime_date(mtime: float) -> str:
+    """Format a file modification time as a capture date, memoized per mtime.
+    
+    The mtime is the key, so a file edited in place gets its new date.
+    
+    Args:
+        mtime: File modification time in seconds
+        
+    Returns:
+        Formatted date string
+    """
+    # Use Arrow to get file modification time
+    return arrow.get(mtime).format("DD MMMM YYYY")
+
+
+def clear_capture_date_cache() -> None:
+    """Clear the memoized capture date strings, e.g. after rescanning photos."""
+    _format_exif_date.cache_clear()
+    _format_mtime_date.cache_clear()
+
+
+# EXIF orientation tag and the orientations that rotate the image by 90 degrees
+EXIF_ORIENTATION_TAG = 0x0112
+_TRANSPOSED_ORIENTATIONS = (5, 6, 7, 8)
+
+
+# Image headers (size, EXIF orientation) almost always fit in the first block
+PROBE_HEADER_BYTES = 64 * 1024
+
+
+def probe_dimensions(image_path: str) -> Tuple[int, int]:
+    """Get an image's display size without decoding its pixel data.
+    
+    Only the first PROBE_HEADER_BYTES of the file are read; the whole file is
+    only opened if the header doesn't fit in that block (e.g. a TIFF whose IFD
+    is stored at the end). The size is swapped when the EXIF orientation
+    rotates the image by 90 degrees, matching what load_photo displays.
+    
+    Args:
+        image_path: Path to the image file
+        
+    Returns:
+        Tuple of (width, height) as displayed
+    """
+    with open(image_path, 'rb') as f:
+        header = f.read(PROBE_HEADER_BYTES)
+    try:
+        return _probe_header(io.BytesIO(header))
+    except Exception:
+        return _probe_header(image_path)
+
+
+def _probe_header(fp) -> Tuple[int, int]:
+    """Read an image's display size from its header.
+    
+    Args:
+        fp: Path or file object of the image
+        
+    Returns:
+        Tuple of (width, height) as displayed
+    """
+    with Image.open(fp) as img:
+        width, height = img.size
+        exif = _header_exif(img)
+        if exif.get(EXIF_ORIENTATION_TAG, 1) in _TRANSPOSED_ORIENTATIONS:
+            width, height = height, width
+    return width, height
+
+
+def photo_file_key(photo_path: str) -> str:
+    """Identify a photo file by its path, modification time and size.
+    
+    A file edited or replaced in place gets a new key, so caches keyed by it
+    never serve the previous contents.
+    
+    Args:
+        photo_path: Path to the photo file
+        
+    Returns:
+        Key string, or the path itself if the file can't be read
+    """
+    try:
+        stat_result = os.stat(photo_path)
+    except OSError:
+        return photo_path
+    return f"{photo_path}:{stat_result.st_mtime_ns}:{stat_result.st_size}"
+
+
 def is_portrait(image_path: str) -> bool:
     """Check if an image is portrait-oriented (height > width).
     
+    Results are memoized process-wide per path, mtime and size, so rescans and
+    other PhotoFileSet instances don't re-read unchanged files.
+    
     Args:
         image_path: Path to the image file
         
@@ -163,9 +447,84 @@ def is_portrait(image_path: str) -> bool:
         True if the image is portrait, False otherwise
     """
     try:
-        with Image.open(image_path) as img:
-            # Check if image is portrait (height > width)
-            return img.height > img.width
-    except Exception as e:
-        print(f"Error checking orientation of {image_path}: {e}")
+        stat_result = os.stat(image_path)
+    except OSError as e:
+        logger.warning("Error checking orientation of %s: %s", image_path, e)
         return False
+    return _is_portrait(image_path, stat_result.st_mtime_ns, stat_result.st_size)
+
+
+@lru_cache(maxsize=65536)
+def _is_portrait(image_path: str, mtime_ns: int, size: int) -> bool:
+    """Check if an image is portrait-oriented, memoized per path, mtime and size.
+    
+    Args:
+        image_path: Path to the image file
+        mtime_ns: File modification time in nanoseconds (cache key only)
+        size: File size in bytes (cache key only)
+        
+    Returns:
+        True if the image is portrait, False otherwise
+    """
+    try:
+        # Check if image is portrait (height > width) as displayed
+        width, height = probe_dimensions(image_path)
+        return height > width
+    except (OSError, SyntaxError, ValueError, Image.DecompressionBombError) as e:
+        logger.warning("Error checking orientation of %s: %s", image_path, e)
+        return False
+
+
+# Pillow's get_ifd key for IFD1, which describes the embedded thumbnail
+EXIF_THUMBNAIL_IFD = -1
+EXIF_THUMBNAIL_OFFSET_TAG = 0x0201
+EXIF_THUMBNAIL_LENGTH_TAG = 0x0202
+
+# How to turn an image upright for each EXIF orientation
+_ORIENTATION_TRANSPOSE = {
+    2: Image.Transpose.FLIP_LEFT_RIGHT,
+    3: Image.Transpose.ROTATE_180,
+    4: Image.Transpose.FLIP_TOP_BOTTOM,
+    5: Image.Transpose.TRANSPOSE,
+    6: Image.Transpose.ROTATE_270,
+    7: Image.Transpose.TRANSVERSE,
+    8: Image.Transpose.ROTATE_90,
+}
+
+
+def load_exif_thumbnail(photo_path: str) -> Optional[Image.Image]:
+    """Decode the small preview image embedded in a photo's EXIF data.
+    
+    Only the file header is read, so this is far cheaper than decoding the
+    photo itself. The thumbnail is rotated upright like load_photo's result.
+    
+    Args:
+        photo_path: Path to the photo file
+        
+    Returns:
+        RGB PIL image of the thumbnail, or None if the photo has none
+    """
+    try:
+        with Image.open(photo_path) as img:
+            raw_exif = img.info.get('exif')
+            if not raw_exif:
+                return None
+            exif = img.getexif()
+            thumbnail_ifd = exif.get_ifd(EXIF_THUMBNAIL_IFD)
+            offset = thumbnail_ifd.get(EXIF_THUMBNAIL_OFFSET_TAG)
+            length = thumbnail_ifd.get(EXIF_THUMBNAIL_LENGTH_TAG)
+            if not offset or not length:
+                return None
+            
+            # Thumbnail offsets are relative to the TIFF header after the "Exif" marker
+            if raw_exif.startswith(b'Exif\x00\x00'):
+                raw_exif = raw_exif[6:]
+            thumbnail = Image.open(io.BytesIO(raw_exif[offset:offset + length]))
+            thumbnail.load()
+            
+            method = _ORIENTATION_TRANSPOSE.get(exif.get(EXIF_ORIENTATION_TAG, 1))
+            if method is not None:
+                thumbnail = thumbnail.transpose(method)
+            return thumbnail.convert('RGB')
+    except Exception:
+        return None
@@ -1,10 +1,21 @@
 """
 Manages UI components for the photo display system.
 """
-from PySide6.QtWidgets import QGraphicsPixmapItem, QGraphicsRectItem, QGraphicsTextItem, QGraphicsOpacityEffect
+from PySide6.QtWidgets import (QGraphicsItem, QGraphicsItemGroup, QGraphicsPixmapItem, QGraphicsRectItem,
+                               QGraphicsScene, QGraphicsTextItem)
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QPixmap, QColor, QBrush, QPen
 
+# Photo layer and position indices for set_opacity
+LAYER_CURRENT = 0
+LAYER_NEXT = 1
+LEFT = 0
+RIGHT = 1
+
+# Indices of the layer and position names set_opacity also accepts
+_LAYER_INDICES = {"current": LAYER_CURRENT, "next": LAYER_NEXT}
+_POSITION_INDICES = {"left": LEFT, "right": RIGHT}
+
 class UIComponentManager:
     """Manages all UI components for photo display."""
     
@@ -16,6 +27,14 @@ class UIComponentManager:
         """
         self.scene = scene
         
+        # The scene only ever holds a handful of items, so a linear scan beats
+        # keeping a BSP tree up to date on every setPos/setPixmap
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+        
+        # Shared pixmap for clearing photo items. QPixmap can't be created
+        # before the QGuiApplication, so this can't be a class attribute.
+        self._empty_pixmap = QPixmap()
+        
         # Set scene background to black
         self.scene.setBackgroundBrush(QBrush(QColor(0, 0, 0)))
         
@@ -23,66 +42,94 @@ class UIComponentManager:
         # Current photos (initially visible)
         self.current_image_left = QGraphicsPixmapItem()
         self.current_image_right = QGraphicsPixmapItem()
-        self.scene.addItem(self.current_image_left)
-        self.scene.addItem(self.current_image_right)
         
         # Next photos (initially invisible)
         self.next_image_left = QGraphicsPixmapItem()
         self.next_image_right = QGraphicsPixmapItem()
-        self.scene.addItem(self.next_image_left)
-        self.scene.addItem(self.next_image_right)
-        
-        # Add opacity effects for fading transitions
-        # For current photos
-        self.opacity_effect_current_left = QGraphicsOpacityEffect()
-        self.opacity_effect_current_right = QGraphicsOpacityEffect()
-        self.current_image_left.setGraphicsEffect(self.opacity_effect_current_left)
-        self.current_image_right.setGraphicsEffect(self.opacity_effect_current_right)
-        self.opacity_effect_current_left.setOpacity(1.0)
-        self.opacity_effect_current_right.setOpacity(1.0)
-        
-        # For next photos
-        self.opacity_effect_next_left = QGraphicsOpacityEffect()
-        self.opacity_effect_next_right = QGraphicsOpacityEffect()
-        self.next_image_left.setGraphicsEffect(self.opacity_effect_next_left)
-        self.next_image_right.setGraphicsEffect(self.opacity_effect_next_right)
-        self.opacity_effect_next_left.setOpacity(0.0)  # Start invisible
-        self.opacity_effect_next_right.setOpacity(0.0)  # Start invisible
-        
-        # Create metadata overlay items (one set for each image)
-        self.metadata_rect_left = QGraphicsRectItem()
-        self.metadata_rect_left.setZValue(1)  # Above the image
-        self.metadata_rect_left.setBrush(QBrush(QColor(0, 0, 0, 0)))  # Start transparent
-        self.metadata_rect_left.setPen(QPen(Qt.PenStyle.NoPen))  # No border
-        self.scene.addItem(self.metadata_rect_left)
-        
-        self.metadata_text_left = QGraphicsTextItem()
-        self.metadata_text_left.setZValue(2)  # Above the rectangle
-        self.metadata_text_left.setDefaultTextColor(QColor(255, 255, 255))  # White text
-        self.scene.addItem(self.metadata_text_left)
-        
-        self.metadata_rect_right = QGraphicsRectItem()
-        self.metadata_rect_right.setZValue(1)  # Above the image
-        self.metadata_rect_right.setBrush(QBrush(QColor(0, 0, 0, 0)))  # Start transparent
-        self.metadata_rect_right.setPen(QPen(Qt.PenStyle.NoPen))  # No border
-        self.scene.addItem(self.metadata_rect_right)
-        
-        self.metadata_text_right = QGraphicsTextItem()
-        self.metadata_text_right.setZValue(2)  # Above the rectangle
-        self.metadata_text_right.setDefaultTextColor(QColor(255, 255, 255))  # White text
-        self.scene.addItem(self.metadata_text_right)
-        
-        # Create clock overlay items
-        self.clock_rect = QGraphicsRectItem()
-        self.clock_rect.setZValue(1)  # Above the image
-        self.clock_rect.setBrush(QBrush(QColor(0, 0, 0, 0)))  # Start transparent
-        self.clock_rect.setPen(QPen(Qt.PenStyle.NoPen))  # No border
-        self.scene.addItem(self.clock_rect)
-        
-        self.clock_text = QGraphicsTextItem()
-        self.clock_text.setZValue(2)  # Above the rectangle
-        self.clock_text.setDefaultTextColor(QColor(255, 255, 255))  # White text
-        self.scene.addItem(self.clock_text)
+        
+        # Each layer's photos are children of one group, so a crossfade sets a
+        # single opacity per layer; the items' own opacity is applied on top
+        # for per-side fades. Group opacity is applied while painting, unlike
+        # a QGraphicsOpacityEffect, which renders each photo offscreen first.
+        self.current_group = QGraphicsItemGroup()
+        self.current_group.addToGroup(self.current_image_left)
+        self.current_group.addToGroup(self.current_image_right)
+        self.scene.addItem(self.current_group)
+        
+        self.next_group = QGraphicsItemGroup()
+        self.next_group.addToGroup(self.next_image_left)
+        self.next_group.addToGroup(self.next_image_right)
+        self.next_group.setOpacity(0.0)  # Start invisible
+        self.scene.addItem(self.next_group)
+        
+        # Photo items indexed by [layer][position], and (left, right) items by
+        # whether the layer is the current one, so setters index instead of branching
+        self._items_grid = (
+            (self.current_image_left, self.current_image_right),
+            (self.next_image_left, self.next_image_right),
+        )
+        self._layer_items = {True: self._items_grid[LAYER_CURRENT], False: self._items_grid[LAYER_NEXT]}
+        self._layer_groups = (self.current_group, self.next_group)
+        
+        # Overlay (rect, text) items by overlay name, created on first use so
+        # deployments that never show metadata or a clock don't carry them
+        self._overlays = {}
+    
+    def _overlay_items(self, name):
+        """Get the background rectangle and text item of an overlay.
+        
+        The items are created and added to the scene on first use. They are
+        added after the photos and the text after its rectangle, so with a
+        shared Z value they paint in that order.
+        
+        Args:
+            name: Overlay name ("metadata_left", "metadata_right" or "clock")
+            
+        Returns:
+            Tuple of (QGraphicsRectItem, QGraphicsTextItem)
+        """
+        items = self._overlays.get(name)
+        if items is None:
+            rect = QGraphicsRectItem()
+            rect.setBrush(QBrush(QColor(0, 0, 0, 0)))  # Start transparent
+            rect.setPen(QPen(Qt.PenStyle.NoPen))  # No border
+            rect.setVisible(False)  # Hidden until its overlay is shown
+            self.scene.addItem(rect)
+            
+            text = QGraphicsTextItem()
+            text.setDefaultTextColor(QColor(255, 255, 255))  # White text
+            text.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)  # Blit text, re-render on change
+            text.setVisible(False)  # Hidden until its overlay is shown
+            self.scene.addItem(text)
+            
+            items = self._overlays[name] = (rect, text)
+        return items
+    
+    def metadata_items(self, position):
+        """Get the metadata overlay items for one image.
+        
+        Args:
+            position: "left" or "right"
+            
+        Returns:
+            Tuple of (QGraphicsRectItem, QGraphicsTextItem)
+        """
+        return self._overlay_items("metadata_" + position)
+    
+    def clock_items(self):
+        """Get the clock overlay items.
+        
+        Returns:
+            Tuple of (QGraphicsRectItem, QGraphicsTextItem)
+        """
+        return self._overlay_items("clock")
+    
+    metadata_rect_left = property(lambda self: self.metadata_items("left")[0])
+    metadata_text_left = property(lambda self: self.metadata_items("left")[1])
+    metadata_rect_right = property(lambda self: self.metadata_items("right")[0])
+    metadata_text_right = property(lambda self: self.metadata_items("right")[1])
+    clock_rect = property(lambda self: self.clock_items()[0])
+    clock_text = property(lambda self: self.clock_items()[1])
     
     def set_scene_rect(self, width, height):
         """Set the scene rectangle to match screen dimensions.
@@ -95,6 +142,20 @@ class UIComponentManager:
         # Ensure the background color remains black when resizing
         self.scene.setBackgroundBrush(QBrush(QColor(0, 0, 0)))
     
+    @staticmethod
+    def _set_pixmap(item, pixmap):
+        """Set an item's pixmap unless it already shows that exact pixmap.
+        
+        setPixmap always invalidates the item's geometry and paint area, while
+        comparing cache keys is cheap; empty pixmaps all share key 0.
+        
+        Args:
+            item: QGraphicsPixmapItem to update
+            pixmap: The new pixmap
+        """
+        if item.pixmap().cacheKey() != pixmap.cacheKey():
+            item.setPixmap(pixmap)
+    
     def set_single_photo(self, is_current, pixmap, x, y):
         """Set a single photo's pixmap and position.
         
@@ -104,14 +165,10 @@ class UIComponentManager:
             x: X position
             y: Y position
         """
-        if is_current:
-            self.current_image_left.setPixmap(pixmap)
-            self.current_image_left.setPos(x, y)
-            self.current_image_right.setPixmap(QPixmap())  # Empty pixmap
-        else:
-            self.next_image_left.setPixmap(pixmap)
-            self.next_image_left.setPos(x, y)
-            self.next_image_right.setPixmap(QPixmap())  # Empty pixmap
+        left, right = self._layer_items[bool(is_current)]
+        self._set_pixmap(left, pixmap)
+        left.setPos(x, y)
+        self._set_pixmap(right, self._empty_pixmap)  # Empty pixmap
     
     def set_photo_pair(self, is_current, pixmap1, x1, y1, pixmap2, x2, y2):
         """Set a photo pair's pixmaps and positions.
@@ -125,75 +182,64 @@ class UIComponentManager:
             x2: Right photo X position
             y2: Right photo Y position
         """
-        if is_current:
-            self.current_image_left.setPixmap(pixmap1)
-            self.current_image_left.setPos(x1, y1)
-            self.current_image_right.setPixmap(pixmap2)
-            self.current_image_right.setPos(x2, y2)
-        else:
-            self.next_image_left.setPixmap(pixmap1)
-            self.next_image_left.setPos(x1, y1)
-            self.next_image_right.setPixmap(pixmap2)
-            self.next_image_right.setPos(x2, y2)
+        left, right = self._layer_items[bool(is_current)]
+        self._set_pixmap(left, pixmap1)
+        left.setPos(x1, y1)
+        self._set_pixmap(right, pixmap2)
+        right.setPos(x2, y2)
     
     def clear_next_photos(self):
         """Clear the next photo pixmaps."""
-        self.next_image_left.setPixmap(QPixmap())
-        self.next_image_right.setPixmap(QPixmap())
+        self._set_pixmap(self.next_image_left, self._empty_pixmap)
+        self._set_pixmap(self.next_image_right, self._empty_pixmap)
     
     def set_opacity(self, layer, position, value):
         """Set opacity for a photo layer.
         
         Args:
-            layer: "current" or "next"
-            position: "left" or "right"
+            layer: LAYER_CURRENT or LAYER_NEXT ("current" or "next" also work)
+            position: LEFT or RIGHT ("left" or "right" also work), or None for
+                the whole layer's group
             value: Opacity value (0.0-1.0)
         """
-        if layer == "current":
-            if position == "left":
-                self.opacity_effect_current_left.setOpacity(value)
-            else:  # "right"
-                self.opacity_effect_current_right.setOpacity(value)
-        else:  # "next"
-            if position == "left":
-                self.opacity_effect_next_left.setOpacity(value)
-            else:  # "right"
-                self.opacity_effect_next_right.setOpacity(value)
+        if isinstance(layer, str):
+            layer = _LAYER_INDICES[layer]
+        if position is None:
+            self._layer_groups[layer].setOpacity(value)
+            return
+        if isinstance(position, str):
+            position = _POSITION_INDICES[position]
+        self._items_grid[layer][position].setOpacity(value)
+    
+    def reset_opacities(self, current=1.0, next=0.0):
+        """Set the opacity of the current and next photo layers in one pass.
+        
+        Per-side opacities are reset to fully opaque, so each layer shows at
+        its group's opacity.
+        
+        Args:
+            current: Opacity value (0.0-1.0) for the current photos
+            next: Opacity value (0.0-1.0) for the next photos
+        """
+        self.current_group.setOpacity(current)
+        self.next_group.setOpacity(next)
+        for items in self._items_grid:
+            for item in items:
+                item.setOpacity(1.0)
     
     def swap_layers(self, mode="single"):
         """Swap current and next layers after transition.
         
         Args:
-            mode: "single" or "pair"
+            mode: "single" or "pair"; a single photo's next right item is
+                already empty, so both modes move the items side by side
         """
-        if mode == "single":
-            # Get the pixmap from next image
-            pixmap = self.next_image_left.pixmap()
-            position = self.next_image_left.pos()
-            
-            # Apply to current image
-            self.current_image_left.setPixmap(pixmap)
-            self.current_image_left.setPos(position)
-            self.current_image_right.setPixmap(QPixmap())  # Clear right image
-        else:  # 'pair'
-            # Get pixmaps and positions from next images
-            pixmap_left = self.next_image_left.pixmap()
-            pixmap_right = self.next_image_right.pixmap()
-            position_left = self.next_image_left.pos()
-            position_right = self.next_image_right.pos()
-            
-            # Apply to current images
-            self.current_image_left.setPixmap(pixmap_left)
-            self.current_image_right.setPixmap(pixmap_right)
-            self.current_image_left.setPos(position_left)
-            self.current_image_right.setPos(position_right)
-        
-        # Clear next images
-        self.next_image_left.setPixmap(QPixmap())
-        self.next_image_right.setPixmap(QPixmap())
+        # Move each next pixmap and position onto its current item, then clear
+        # the next item; clearing an already empty item is a no-op
+        for current, following in zip(self._layer_items[True], self._layer_items[False]):
+            self._set_pixmap(current, following.pixmap())
+            current.setPos(following.pos())
+            self._set_pixmap(following, self._empty_pixmap)
         
         # Reset opacities
-        self.opacity_effect_current_left.setOpacity(1.0)
-        self.opacity_effect_current_right.setOpacity(1.0)
-        self.opacity_effect_next_left.setOpacity(0.0)
-        self.opacity_effect_next_right.setOpacity(0.0)
+        self.reset_opacities(1.0, 0.0)